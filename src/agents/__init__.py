@@ -1,10 +1,39 @@
 """Agents package."""
+import importlib
+from typing import TYPE_CHECKING, Any
+
 from src.agents.base_agent import BaseAgent, AgentResult, AgentStatus, AgentError
-from .git_agent import GitAgent
-from .sonar_agent import SonarQubeAgent
-from .analyzer_agent import AnalyzerAgent
-from .test_gen_agent import TestGeneratorAgent
-from .pr_agent import PRAzureDevOpsAgent
+
+if TYPE_CHECKING:
+    from .git_agent import GitAgent
+    from .sonar_agent import SonarQubeAgent
+    from .analyzer_agent import AnalyzerAgent
+    from .test_gen_agent import TestGeneratorAgent
+    from .pr_agent import PRAzureDevOpsAgent
+
+# Agents are imported on first access so that using one agent does not pull
+# in the SDKs (GitPython, Azure DevOps, httpx) required by the others.
+_LAZY_EXPORTS = {
+    "GitAgent": ".git_agent",
+    "SonarQubeAgent": ".sonar_agent",
+    "AnalyzerAgent": ".analyzer_agent",
+    "TestGeneratorAgent": ".test_gen_agent",
+    "PRAzureDevOpsAgent": ".pr_agent",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(list(globals()) + list(_LAZY_EXPORTS))
+
 
 __all__ = [
     "BaseAgent",
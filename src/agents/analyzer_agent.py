@@ -1,4 +1,5 @@
 """Code analyzer agent for identifying test candidates."""
+import os
 from pathlib import Path
 from typing import Dict, Any, List, Optional
 
@@ -6,7 +7,14 @@ from .base_agent import BaseAgent, AgentResult, AgentStatus, AgentError
 
 
 class TestCandidate:
-    """General test candidate information for any language."""
+    """
+    General test candidate information for any language.
+
+    Kept for external callers; AnalyzerAgent builds candidate dicts directly.
+    """
+
+    __slots__ = ("file_path", "uncovered_area", "language")
+
     def __init__(self, file_path: str, uncovered_area: Any, language: str):
         self.file_path = file_path
         self.uncovered_area = uncovered_area  # Could be line numbers, blocks, etc.
@@ -47,24 +55,29 @@ class AnalyzerAgent(BaseAgent):
         uncovered_files = context["uncovered_files"]
 
         try:
-            test_candidates = []
-            for file_info in uncovered_files:
-                file_path = str(repo_path / file_info["path"])
-                uncovered_area = file_info.get("uncovered_area")
-                language = file_info.get("language", "unknown")
-                candidate = TestCandidate(file_path, uncovered_area, language)
-                test_candidates.append(candidate)
+            # Plain string concat avoids a PurePath allocation per file. SonarQube
+            # paths always use "/", so normalise them to the platform separator
+            # to match the prefixes TestGeneratorAgent builds with os.sep.
+            repo_prefix = os.path.join(str(repo_path), "")
+            test_candidates = [
+                {
+                    "file_path": repo_prefix + os.path.normpath(file_info["path"]),
+                    "uncovered_area": file_info.get("uncovered_area"),
+                    "language": file_info.get("language", "unknown"),
+                }
+                for file_info in uncovered_files
+            ]
 
-            self.logger.info(f"Identified {len(test_candidates)} test candidates (multi-language)")
+            self.logger.info("Identified %s test candidates (multi-language)", len(test_candidates))
 
             return AgentResult(
                 status=AgentStatus.SUCCESS,
                 data={
-                    "test_candidates": [c.to_dict() for c in test_candidates],
+                    "test_candidates": test_candidates,
                     "total_candidates": len(test_candidates),
                 },
                 metadata={"analyzed_files": len(test_candidates)}
             )
         except Exception as e:
-            self.logger.error(f"Code analysis failed: {e}")
+            self.logger.error("Code analysis failed: %s", e)
             raise AgentError(f"Analysis error: {e}")
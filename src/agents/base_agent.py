@@ -1,10 +1,15 @@
 """Base agent interface for all agents."""
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional, Sequence
 from enum import Enum
 
 from ..utils.logger import get_logger
 
+# Shared read-only stand-in for omitted result data/metadata
+_EMPTY: Mapping[str, Any] = MappingProxyType({})
+
 
 class AgentStatus(str, Enum):
     """Agent execution status."""
@@ -18,6 +23,8 @@ class AgentStatus(str, Enum):
 class AgentResult:
     """Result from agent execution."""
 
+    __slots__ = ("status", "data", "error", "metadata")
+
     def __init__(
         self,
         status: AgentStatus,
@@ -30,14 +37,14 @@ class AgentResult:
 
         Args:
             status: Execution status
-            data: Result data
+            data: Result data (read-only empty mapping if omitted)
             error:  Error message if failed
-            metadata: Additional metadata
+            metadata: Additional metadata (read-only empty mapping if omitted)
         """
         self.status = status
-        self.data = data or {}
+        self.data = data if data is not None else _EMPTY
         self.error = error
-        self.metadata = metadata or {}
+        self.metadata = metadata if metadata is not None else _EMPTY
 
     def is_success(self) -> bool:
         """Check if execution was successful."""
@@ -61,7 +68,7 @@ class BaseAgent(ABC):
         self.name = name or self.__class__.__name__
         self.config = kwargs
         self.logger = get_logger(f"agent.{self.name}")
-        self.logger.info(f"Initialized {self.name}")
+        self.logger.info("Initialized %s", self.name)
 
     @abstractmethod
     def execute(self, context: Dict[str, Any]) -> AgentResult:
@@ -79,17 +86,35 @@ class BaseAgent(ABC):
         """
         pass
 
-    def validate_context(self, context: Dict[str, Any], required_keys: list[str]) -> None:
+    async def async_execute(self, context: Dict[str, Any]) -> AgentResult:
+        """
+        Execute the agent's task without blocking the event loop.
+
+        The default implementation runs ``execute`` in a worker thread;
+        agents with native async I/O override this.
+
+        Args:
+            context: Execution context with necessary data
+
+        Returns:
+            AgentResult with execution outcome
+        """
+        return await asyncio.to_thread(self.execute, context)
+
+    def validate_context(self, context: Dict[str, Any], required_keys: Sequence[str]) -> None:
         """
         Validate that required keys are present in context.
 
         Args:
             context: Context dictionary to validate
-            required_keys: List of required keys
+            required_keys: Sequence of required keys
 
         Raises:
             ValueError: If any required key is missing
         """
+        # Short-circuit on the happy path; only build the full list on error
+        if all(key in context for key in required_keys):
+            return
         missing_keys = [key for key in required_keys if key not in context]
         if missing_keys:
             raise ValueError(
@@ -106,21 +131,44 @@ class BaseAgent(ABC):
         Returns:
             AgentResult
         """
-        self.logger.info(f"Starting {self.name}")
+        self.logger.info("Starting %s", self.name)
         try:
-            result = self.execute(context)
-            if result.is_success():
-                self.logger.info(f"{self.name} completed successfully")
-            else:
-                self.logger.warning(f"{self.name} completed with status: {result.status.value}")
-            return result
+            return self._log_result(self.execute(context))
         except Exception as e:
-            self.logger.error(f"{self.name} failed: {e}", exc_info=True)
-            return AgentResult(
-                status=AgentStatus.FAILED,
-                error=str(e),
-                metadata={"exception_type": type(e).__name__}
-            )
+            return self._failed_result(e)
+
+    async def arun(self, context: Dict[str, Any]) -> AgentResult:
+        """
+        Async counterpart of ``run`` built on ``async_execute``.
+
+        Args:
+            context: Execution context
+
+        Returns:
+            AgentResult
+        """
+        self.logger.info("Starting %s", self.name)
+        try:
+            return self._log_result(await self.async_execute(context))
+        except Exception as e:
+            return self._failed_result(e)
+
+    def _log_result(self, result: AgentResult) -> AgentResult:
+        """Log the outcome of a completed execution."""
+        if result.is_success():
+            self.logger.info("%s completed successfully", self.name)
+        else:
+            self.logger.warning("%s completed with status: %s", self.name, result.status.value)
+        return result
+
+    def _failed_result(self, error: Exception) -> AgentResult:
+        """Log an execution error and wrap it in a failed AgentResult."""
+        self.logger.error("%s failed: %s", self.name, error, exc_info=True)
+        return AgentResult(
+            status=AgentStatus.FAILED,
+            error=str(error),
+            metadata={"exception_type": type(error).__name__}
+        )
 
 
 class AgentError(Exception):
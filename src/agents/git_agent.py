@@ -1,13 +1,17 @@
 """Git agent for repository operations using Azure DevOps."""
+import base64
+import os
 import shutil
+import subprocess
 from pathlib import Path
-from typing import Dict, Any, Optional
-
-import git
+from typing import TYPE_CHECKING, Dict, Any, List, Optional, Tuple
 
 from .base_agent import BaseAgent, AgentResult, AgentStatus, AgentError
 from ..utils.helpers import sanitize_branch_name
 
+if TYPE_CHECKING:
+    import git
+
 
 class GitAgent(BaseAgent):
     """Agent for Git operations with Azure DevOps support."""
@@ -37,20 +41,30 @@ class GitAgent(BaseAgent):
         self.token = token
         self.base_branch = base_branch
         self.branch_prefix = branch_prefix
-        self.repo: Optional[git.Repo] = None
+        self.repo: Optional["git.Repo"] = None
         self.repo_path: Optional[Path] = None
 
+        # Send the PAT as an HTTP header via git's env-based config instead of
+        # embedding it in the remote URL (keeps it out of argv and .git/config)
+        credentials = base64.b64encode(f":{token}".encode()).decode()
+        self._auth_env = {
+            "GIT_CONFIG_COUNT": "1",
+            "GIT_CONFIG_KEY_0": "http.extraHeader",
+            "GIT_CONFIG_VALUE_0": f"Authorization: Basic {credentials}",
+        }
+
     def execute(self, context: Dict[str, Any]) -> AgentResult:
         """
         Execute Git operations based on context.
 
         Expected context keys:
-            - operation: 'clone', 'create_branch', 'commit', 'push'
+            - operation: 'clone', 'open', 'create_branch', 'commit', 'push'
             - repo_url: Repository URL (for clone)
-            - local_path: Local path for repository
+            - local_path: Local path for repository (for clone and open)
+            - full_history: Clone full history instead of a shallow clone (optional)
             - branch_name: Branch name (optional, generated if not provided)
             - commit_message: Commit message (for commit)
-            - files_to_add: List of file paths to stage (for commit)
+            - files_to_add: File paths to stage, absolute or relative to the repository root (for commit)
 
         Returns:
             AgentResult with operation outcome
@@ -60,6 +74,8 @@ class GitAgent(BaseAgent):
         try:
             if operation == "clone":
                 return self._clone_repository(context)
+            elif operation == "open":
+                return self._open_repository(context)
             elif operation == "create_branch":
                 return self._create_branch(context)
             elif operation == "commit":
@@ -69,34 +85,55 @@ class GitAgent(BaseAgent):
             else:
                 raise AgentError(f"Unknown operation: {operation}")
         except Exception as e:
-            self.logger.error(f"Git operation '{operation}' failed: {e}")
+            self.logger.error("Git operation '%s' failed: %s", operation, e)
             raise
 
     def _clone_repository(self, context: Dict[str, Any]) -> AgentResult:
         """Clone repository from Azure DevOps."""
+        import git
+
         self.validate_context(context, ["repo_url", "local_path"])
         
         repo_url = context["repo_url"]
-        local_path = Path(context["local_path"])
+        # Absolute, so paths derived from repo_path stay valid whatever the CWD
+        local_path = Path(context["local_path"]).resolve()
 
-        # Add authentication to URL
-        if "@" not in repo_url:
-            # Insert token into URL
-            if "https://" in repo_url:
-                auth_url = repo_url.replace("https://", f"https://{self.token}@")
-            else:
-                auth_url = repo_url
-        else:
-            auth_url = repo_url
+        full_history = context.get("full_history", False)
 
         try:
-            # Remove existing directory if it exists
-            if local_path.exists():
-                self.logger.warning(f"Removing existing directory: {local_path}")
-                shutil.rmtree(local_path)
+            if (local_path / ".git").is_dir():
+                # Refresh the existing checkout instead of recloning
+                self.logger.info("Updating existing repository at %s", local_path)
+                self.repo = git.Repo(local_path)
+                self.repo.git.update_environment(**self._auth_env)
+                origin = self.repo.remote("origin")
+                origin.set_url(repo_url)
+                if full_history:
+                    origin.fetch(self.base_branch)
+                else:
+                    origin.fetch(self.base_branch, depth=1)
+                self.repo.git.checkout("-f", "-B", self.base_branch, "FETCH_HEAD")
+                self.repo.git.clean("-fdx")
+            else:
+                if local_path.exists():
+                    self.logger.warning("Removing existing directory: %s", local_path)
+                    shutil.rmtree(local_path)
+
+                # Only the working tree is needed unless history is requested
+                multi_options = ["--single-branch"]
+                if not full_history:
+                    multi_options += ["--depth=1", "--filter=blob:none"]
 
-            self.logger.info(f"Cloning repository to {local_path}")
-            self.repo = git.Repo.clone_from(auth_url, local_path, branch=self.base_branch)
+                self.logger.info("Cloning repository to %s", local_path)
+                self.repo = git.Repo.clone_from(
+                    repo_url,
+                    local_path,
+                    branch=self.base_branch,
+                    multi_options=multi_options,
+                    env=self._auth_env,
+                )
+                # Reuse the same credentials for later fetch/push calls
+                self.repo.git.update_environment(**self._auth_env)
             self.repo_path = local_path
 
             return AgentResult(
@@ -110,10 +147,31 @@ class GitAgent(BaseAgent):
         except git.GitCommandError as e:
             raise AgentError(f"Failed to clone repository: {e}")
 
+    def _open_repository(self, context: Dict[str, Any]) -> AgentResult:
+        """Open an existing checkout, e.g. one cloned by another agent instance."""
+        import git
+
+        self.validate_context(context, ["local_path"])
+
+        local_path = Path(context["local_path"]).resolve()
+
+        try:
+            self.repo = git.Repo(local_path)
+        except (git.InvalidGitRepositoryError, git.NoSuchPathError) as e:
+            raise AgentError(f"Failed to open repository at {local_path}: {e}")
+        self.repo.git.update_environment(**self._auth_env)
+        self.repo_path = local_path
+
+        return AgentResult(
+            status=AgentStatus.SUCCESS,
+            data={"repo_path": str(local_path)},
+            metadata={"operation": "open"}
+        )
+
     def _create_branch(self, context: Dict[str, Any]) -> AgentResult:
         """Create a new branch for changes."""
         if not self.repo:
-            raise AgentError("Repository not initialized. Run clone operation first.")
+            raise AgentError("Repository not initialized. Run clone or open operation first.")
 
         branch_name = context.get("branch_name")
         if not branch_name:
@@ -124,23 +182,22 @@ class GitAgent(BaseAgent):
 
         try:
             # Create and checkout new branch
-            new_branch = self.repo.create_head(branch_name)
-            new_branch.checkout()
+            self._run_git("switch", "-c", branch_name)
 
-            self.logger.info(f"Created and checked out branch: {branch_name}")
+            self.logger.info("Created and checked out branch: %s", branch_name)
 
             return AgentResult(
                 status=AgentStatus.SUCCESS,
                 data={"branch_name": branch_name},
                 metadata={"operation": "create_branch"}
             )
-        except git.GitCommandError as e:
-            raise AgentError(f"Failed to create branch: {e}")
+        except subprocess.CalledProcessError as e:
+            raise AgentError(f"Failed to create branch: {e.stderr or e}")
 
     def _commit_changes(self, context: Dict[str, Any]) -> AgentResult:
         """Commit changes to the repository."""
         if not self.repo:
-            raise AgentError("Repository not initialized. Run clone operation first.")
+            raise AgentError("Repository not initialized. Run clone or open operation first.")
 
         self.validate_context(context, ["commit_message"])
 
@@ -148,15 +205,19 @@ class GitAgent(BaseAgent):
         files_to_add = context.get("files_to_add", [])
 
         try:
-            # Add files
+            # Stage only the touched paths; avoid rewalking the whole tree.
+            # git runs in the repository root, so relative paths resolve there.
             if files_to_add:
-                self.repo.index.add(files_to_add)
+                self._run_git("add", "--", *map(str, files_to_add))
             else:
-                # Add all changes
-                self.repo.git.add(A=True)
+                changed, removed = self._changed_paths()
+                if changed:
+                    self._run_git("add", "--", *changed)
+                if removed:
+                    self._run_git("rm", "--cached", "--quiet", "--", *removed)
 
             # Check if there are changes to commit
-            if not self.repo.index.diff("HEAD"):
+            if self._run_git("diff", "--cached", "--quiet", check=False).returncode == 0:
                 self.logger.info("No changes to commit")
                 return AgentResult(
                     status=AgentStatus.SKIPPED,
@@ -164,31 +225,92 @@ class GitAgent(BaseAgent):
                     metadata={"operation": "commit"}
                 )
 
-            # Commit
-            commit = self.repo.index.commit(commit_message)
-            self.logger.info(f"Committed changes: {commit.hexsha[:7]}")
+            # Commit with an explicit identity: the git CLI refuses to commit
+            # without user.name/user.email, which CI hosts often lack
+            self._run_git("commit", "--quiet", "-m", commit_message, env=self._identity_env())
+            commit_sha = self._run_git("rev-parse", "HEAD").stdout.strip()
+            self.logger.info("Committed changes: %s", commit_sha[:7])
 
             return AgentResult(
                 status=AgentStatus.SUCCESS,
                 data={
-                    "commit_sha": commit.hexsha,
+                    "commit_sha": commit_sha,
                     "commit_message": commit_message,
                 },
                 metadata={"operation": "commit"}
             )
-        except git.GitCommandError as e:
-            raise AgentError(f"Failed to commit changes: {e}")
+        except subprocess.CalledProcessError as e:
+            raise AgentError(f"Failed to commit changes: {e.stderr or e}")
+
+    def _identity_env(self) -> Dict[str, str]:
+        """
+        Author and committer for CLI commits, resolved like GitPython's index.commit.
+
+        Uses the GIT_AUTHOR_*/GIT_COMMITTER_* variables or the repository's
+        git config when set, falling back to user@hostname.
+        """
+        import git
+
+        config_reader = self.repo.config_reader()
+        author = git.Actor.author(config_reader)
+        committer = git.Actor.committer(config_reader)
+        return {
+            "GIT_AUTHOR_NAME": author.name,
+            "GIT_AUTHOR_EMAIL": author.email,
+            "GIT_COMMITTER_NAME": committer.name,
+            "GIT_COMMITTER_EMAIL": committer.email,
+        }
+
+    def _run_git(
+        self,
+        *args: str,
+        check: bool = True,
+        env: Optional[Dict[str, str]] = None
+    ) -> subprocess.CompletedProcess:
+        """Run a git command directly in the repository working tree."""
+        return subprocess.run(
+            ["git", *args],
+            cwd=self.repo_path,
+            env={**os.environ, **self._auth_env, **(env or {})},
+            check=check,
+            capture_output=True,
+            text=True,
+        )
+
+    def _changed_paths(self) -> Tuple[List[str], List[str]]:
+        """Return (changed_or_new, deleted) paths from ``git status --porcelain``."""
+        entries = self._run_git("status", "--porcelain", "-z", "--untracked-files=all").stdout.split("\0")
+        changed: List[str] = []
+        removed: List[str] = []
+        skip_next = False
+        for entry in entries:
+            if skip_next:
+                # Original path of a rename/copy entry
+                skip_next = False
+                continue
+            if not entry:
+                continue
+            code, path = entry[:2], entry[3:]
+            if code[0] in "RC":
+                skip_next = True
+            if "D" in code:
+                removed.append(path)
+            else:
+                changed.append(path)
+        return changed, removed
 
     def _push_changes(self, context: Dict[str, Any]) -> AgentResult:
         """Push changes to remote repository."""
+        import git
+
         if not self.repo:
-            raise AgentError("Repository not initialized. Run clone operation first.")
+            raise AgentError("Repository not initialized. Run clone or open operation first.")
 
         try:
-            current_branch = self.repo.active_branch.name
+            current_branch = self._run_git("rev-parse", "--abbrev-ref", "HEAD").stdout.strip()
             origin = self.repo.remote("origin")
             
-            self.logger.info(f"Pushing branch {current_branch} to origin")
+            self.logger.info("Pushing branch %s to origin", current_branch)
             origin.push(current_branch)
 
             return AgentResult(
@@ -196,5 +318,5 @@ class GitAgent(BaseAgent):
                 data={"pushed_branch": current_branch},
                 metadata={"operation": "push"}
             )
-        except git.GitCommandError as e:
+        except (git.GitCommandError, subprocess.CalledProcessError) as e:
             raise AgentError(f"Failed to push changes: {e}")
@@ -1,15 +1,37 @@
 """PR agent for creating pull requests in Azure DevOps."""
-from typing import Dict, Any, List
-from azure.devops.connection import Connection
-from msrest.authentication import BasicAuthentication
-from azure.devops.v7_0.git.models import GitPullRequest, GitPullRequestSearchCriteria
+import asyncio
+import threading
+from typing import Dict, Any, List, Tuple
 
 from .base_agent import BaseAgent, AgentResult, AgentStatus, AgentError
 
+# Invariant sections of every PR description
+_PR_HEADER = "\n".join([
+    "## 🤖 Automated Code Coverage Improvement",
+    "",
+    "This pull request was automatically generated to improve code coverage.",
+    "",
+])
+
+_PR_FOOTER = "\n".join([
+    "### Review Checklist",
+    "- [ ] Tests are comprehensive and cover edge cases",
+    "- [ ] All tests pass locally",
+    "- [ ] No breaking changes introduced",
+    "- [ ] Code follows project style guidelines",
+    "",
+    "---",
+    "*Generated by Code Coverage Agent*",
+])
+
 
 class PRAzureDevOpsAgent(BaseAgent):
     """Agent for creating pull requests in Azure DevOps."""
 
+    # (organization_url, token) -> (Connection, GitClient), shared by all instances
+    _client_cache: Dict[Tuple[str, str], Tuple[Any, Any]] = {}
+    _client_cache_lock = threading.Lock()
+
     def __init__(
         self,
         organization_url: str,
@@ -33,10 +55,25 @@ class PRAzureDevOpsAgent(BaseAgent):
         self.token = token
         self.base_branch = base_branch
         
-        # Initialize Azure DevOps connection
-        credentials = BasicAuthentication('', token)
-        self.connection = Connection(base_url=organization_url, creds=credentials)
-        self.git_client = self.connection.clients.get_git_client()
+        self.connection, self.git_client = self._get_clients(organization_url, token)
+
+    @classmethod
+    def _get_clients(cls, organization_url: str, token: str) -> Tuple[Any, Any]:
+        """Return the cached Azure DevOps connection and git client, creating them once."""
+        key = (organization_url, token)
+        with cls._client_cache_lock:
+            clients = cls._client_cache.get(key)
+            if clients is None:
+                # Imported here so the Azure SDK loads only when this agent is used
+                from azure.devops.connection import Connection
+                from msrest.authentication import BasicAuthentication
+
+                # Initialize Azure DevOps connection
+                credentials = BasicAuthentication('', token)
+                connection = Connection(base_url=organization_url, creds=credentials)
+                clients = (connection, connection.clients.get_git_client())
+                cls._client_cache[key] = clients
+            return clients
 
     def execute(self, context: Dict[str, Any]) -> AgentResult:
         """
@@ -52,6 +89,8 @@ class PRAzureDevOpsAgent(BaseAgent):
         Returns:
             AgentResult with PR information
         """
+        from azure.devops.v7_0.git.models import GitPullRequest
+
         self.validate_context(context, ["repository_id", "source_branch", "pr_title"])
         
         repository_id = context["repository_id"]
@@ -77,7 +116,7 @@ class PRAzureDevOpsAgent(BaseAgent):
                 description=full_description
             )
 
-            self.logger.info(f"Creating PR: {pr_title}")
+            self.logger.info("Creating PR: %s", pr_title)
             created_pr = self.git_client.create_pull_request(
                 git_pull_request_to_create=pr,
                 repository_id=repository_id,
@@ -86,7 +125,7 @@ class PRAzureDevOpsAgent(BaseAgent):
 
             pr_url = f"{self.organization_url}/{self.project}/_git/{repository_id}/pullrequest/{created_pr.pull_request_id}"
             
-            self.logger.info(f"Created PR #{created_pr.pull_request_id}: {pr_url}")
+            self.logger.info("Created PR #%s: %s", created_pr.pull_request_id, pr_url)
 
             return AgentResult(
                 status=AgentStatus.SUCCESS,
@@ -100,9 +139,47 @@ class PRAzureDevOpsAgent(BaseAgent):
                 metadata={"repository": repository_id}
             )
         except Exception as e:
-            self.logger.error(f"Failed to create PR: {e}")
+            self.logger.error("Failed to create PR: %s", e)
             raise AgentError(f"PR creation failed: {e}")
 
+    async def execute_many(
+        self,
+        contexts: List[Dict[str, Any]],
+        max_parallel: int = 8,
+    ) -> List[AgentResult]:
+        """
+        Create several pull requests concurrently.
+
+        The Azure DevOps SDK is synchronous, so each PR is created in a worker
+        thread sharing this agent's connection and git client.
+
+        Args:
+            contexts: One ``execute`` context per pull request
+            max_parallel: Maximum number of PRs created at the same time
+
+        Returns:
+            AgentResult per context, in the same order as ``contexts``
+        """
+        semaphore = asyncio.Semaphore(max_parallel)
+
+        async def create_one(context: Dict[str, Any]) -> AgentResult:
+            async with semaphore:
+                return await asyncio.to_thread(self.execute, context)
+
+        results = await asyncio.gather(
+            *(create_one(context) for context in contexts),
+            return_exceptions=True,
+        )
+
+        return [
+            result if isinstance(result, AgentResult) else AgentResult(
+                status=AgentStatus.FAILED,
+                error=str(result),
+                metadata={"exception_type": type(result).__name__}
+            )
+            for result in results
+        ]
+
     def _build_pr_description(
         self,
         description: str,
@@ -117,10 +194,7 @@ class PRAzureDevOpsAgent(BaseAgent):
             lines.append(description)
             lines.append("")
         
-        lines.append("## 🤖 Automated Code Coverage Improvement")
-        lines.append("")
-        lines.append("This pull request was automatically generated to improve code coverage.")
-        lines.append("")
+        lines.append(_PR_HEADER)
 
         if coverage_before is not None:
             lines.append("### Coverage Metrics")
@@ -133,17 +207,9 @@ class PRAzureDevOpsAgent(BaseAgent):
 
         if test_files:
             lines.append(f"### Generated Test Files ({len(test_files)})")
-            for test_file in test_files:
-                lines.append(f"- `{test_file}`")
+            lines.extend(f"- `{test_file}`" for test_file in test_files)
             lines.append("")
 
-        lines.append("### Review Checklist")
-        lines.append("- [ ] Tests are comprehensive and cover edge cases")
-        lines.append("- [ ] All tests pass locally")
-        lines.append("- [ ] No breaking changes introduced")
-        lines.append("- [ ] Code follows project style guidelines")
-        lines.append("")
-        lines.append("---")
-        lines.append("*Generated by Code Coverage Agent*")
+        lines.append(_PR_FOOTER)
 
         return "\n".join(lines)
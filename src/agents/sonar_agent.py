@@ -1,10 +1,91 @@
 """SonarQube agent for fetching code coverage metrics."""
-from typing import Dict, Any
-from pathlib import Path
+import asyncio
+import math
+import threading
+from typing import TYPE_CHECKING, Dict, Any, List, Optional, Tuple
 
-import requests
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:  # orjson is optional
+    import json
+    _json_loads = json.loads
+
+try:
+    import ijson
+except ImportError:  # ijson is optional; pages are parsed whole without it
+    ijson = None
 
 from .base_agent import BaseAgent, AgentResult, AgentStatus, AgentError
+from ..utils.helpers import run_async
+
+if TYPE_CHECKING:
+    import httpx
+
+# Maximum page size accepted by the component_tree API
+_PAGE_SIZE = 500
+
+# One parsed component_tree page: (uncovered files, uncovered lines, paging total)
+_PageData = Tuple[List[Dict[str, Any]], int, int]
+
+# File extension -> language, used when SonarQube omits the language
+_EXT_LANG = {
+    ".py": "python",
+    ".js": "javascript",
+    ".ts": "typescript",
+    ".java": "java",
+    ".cs": "csharp",
+    ".cpp": "cpp",
+    ".c": "c",
+    ".go": "go",
+    ".rb": "ruby",
+    ".php": "php",
+    ".swift": "swift",
+    ".kt": "kotlin",
+    ".scala": "scala",
+    ".rs": "rust",
+    ".m": "objective-c",
+    ".dart": "dart",
+    ".pl": "perl",
+    ".sh": "shell",
+}
+
+
+def _aggregate_components(components: List[Dict[str, Any]]) -> Tuple[List[Dict[str, Any]], int]:
+    """
+    Collect files with incomplete coverage from component_tree components.
+
+    Returns:
+        Tuple of (uncovered file records, total uncovered lines)
+    """
+    # Bind lookups locally; this loop runs once per file in the project
+    ext_lang_get = _EXT_LANG.get
+    uncovered_files: List[Dict[str, Any]] = []
+    append = uncovered_files.append
+    uncovered_total = 0
+
+    for component in components:
+        coverage = 100.0
+        uncovered = 0
+        for measure in component.get("measures", ()):
+            metric = measure["metric"]
+            if metric == "coverage":
+                coverage = float(measure.get("value", 100))
+            elif metric == "uncovered_lines":
+                uncovered = int(measure.get("value", 0))
+        if coverage < 100:  # Has uncovered lines
+            path = component["path"]
+            append({
+                "path": path,
+                "coverage": coverage,
+                "uncovered_area": uncovered,
+                "language": component.get("language") or ext_lang_get(
+                    "." + path.rpartition(".")[2].lower(), "unknown"
+                ),
+            })
+            uncovered_total += uncovered
+
+    return uncovered_files, uncovered_total
 
 
 class SonarQubeAgent(BaseAgent):
@@ -26,8 +107,11 @@ class SonarQubeAgent(BaseAgent):
         super().__init__(**kwargs)
         self.sonar_url = sonar_url.rstrip("/")
         self.sonar_token = sonar_token
-        self.session = requests.Session()
-        self.session.auth = (sonar_token, "")
+        # project_key -> page -> (ETag, page data) for conditional re-fetches.
+        # Runs work on a copy of a project's pages and publish it when done,
+        # so concurrent runs sharing this agent never mutate the same dict.
+        self._coverage_cache: Dict[str, Dict[int, Tuple[str, _PageData]]] = {}
+        self._coverage_cache_lock = threading.Lock()
 
     def execute(self, context: Dict[str, Any]) -> AgentResult:
         """
@@ -40,14 +124,22 @@ class SonarQubeAgent(BaseAgent):
             AgentResult with coverage data
         """
         self.validate_context(context, ["project_key"])
-        project_key = context["project_key"]
+        return run_async(self._execute_async(context["project_key"]))
+
+    async def async_execute(self, context: Dict[str, Any]) -> AgentResult:
+        """Fetch coverage metrics on the caller's event loop."""
+        self.validate_context(context, ["project_key"])
+        return await self._execute_async(context["project_key"])
 
+    async def _execute_async(self, project_key: str) -> AgentResult:
+        """Fetch metrics and coverage details concurrently."""
         try:
-            # Fetch project metrics
-            metrics_data = self._fetch_metrics(project_key)
-            
-            # Fetch detailed coverage info
-            coverage_details = self._fetch_coverage_details(project_key)
+            # One pooled client per execution, closed with the event loop it runs on
+            async with self._create_client() as client:
+                metrics_data, coverage_details = await asyncio.gather(
+                    self._fetch_metrics(client, project_key),
+                    self._fetch_coverage_details(client, project_key),
+                )
 
             coverage_value = metrics_data.get("coverage", 0.0)
             
@@ -63,11 +155,25 @@ class SonarQubeAgent(BaseAgent):
                 metadata={"sonar_url": self.sonar_url}
             )
         except Exception as e:
-            self.logger.error(f"Failed to fetch SonarQube data: {e}")
+            self.logger.error("Failed to fetch SonarQube data: %s", e)
             raise AgentError(f"SonarQube API error: {e}")
 
-    def _fetch_metrics(self, project_key: str) -> Dict[str, float]:
+    def _create_client(self) -> "httpx.AsyncClient":
+        """Create the HTTP client used for one execution."""
+        import httpx
+
+        # HTTP/2 lets concurrent page requests multiplex over one connection
+        return httpx.AsyncClient(
+            auth=(self.sonar_token, ""),
+            http2=True,
+            timeout=30,
+            limits=httpx.Limits(max_connections=32, max_keepalive_connections=16),
+        )
+
+    async def _fetch_metrics(self, client: "httpx.AsyncClient", project_key: str) -> Dict[str, float]:
         """Fetch project metrics from SonarQube."""
+        import httpx
+
         url = f"{self.sonar_url}/api/measures/component"
         params = {
             "component": project_key,
@@ -75,9 +181,9 @@ class SonarQubeAgent(BaseAgent):
         }
 
         try:
-            response = self.session.get(url, params=params, timeout=30)
+            response = await client.get(url, params=params)
             response.raise_for_status()
-            data = response.json()
+            data = _json_loads(response.content)
 
             metrics = {}
             for measure in data.get("component", {}).get("measures", []):
@@ -85,71 +191,142 @@ class SonarQubeAgent(BaseAgent):
                 metric_value = float(measure.get("value", 0))
                 metrics[metric_key] = metric_value
 
-            self.logger.info(f"Fetched metrics for {project_key}: {metrics}")
+            self.logger.info("Fetched metrics for %s: %s", project_key, metrics)
             return metrics
-        except requests.RequestException as e:
+        except httpx.HTTPError as e:
             raise AgentError(f"Failed to fetch metrics: {e}")
 
-    def _fetch_coverage_details(self, project_key: str) -> Dict[str, Any]:
+    async def _fetch_coverage_details(
+        self,
+        client: "httpx.AsyncClient",
+        project_key: str,
+    ) -> Dict[str, Any]:
         """Fetch detailed coverage information."""
-        # This is simplified - in production you'd fetch file-level coverage
+        import httpx
+
         url = f"{self.sonar_url}/api/measures/component_tree"
         params = {
             "component": project_key,
             "metricKeys": "coverage,uncovered_lines",
             "qualifiers": "FIL",  # Files only
-            "ps": 100,  # Page size
+            "ps": _PAGE_SIZE,
         }
 
-        # Helper: infer language from file extension
-        def infer_language(path: str) -> str:
-            ext = Path(path).suffix.lower()
-            return {
-                ".py": "python",
-                ".js": "javascript",
-                ".ts": "typescript",
-                ".java": "java",
-                ".cs": "csharp",
-                ".cpp": "cpp",
-                ".c": "c",
-                ".go": "go",
-                ".rb": "ruby",
-                ".php": "php",
-                ".swift": "swift",
-                ".kt": "kotlin",
-                ".scala": "scala",
-                ".rs": "rust",
-                ".m": "objective-c",
-                ".dart": "dart",
-                ".pl": "perl",
-                ".sh": "shell",
-            }.get(ext, "unknown")
-
         try:
-            response = self.session.get(url, params=params, timeout=30)
-            response.raise_for_status()
-            data = response.json()
-
-            uncovered_files = []
-            for component in data.get("components", []):
-                measures = {m["metric"]: m.get("value") for m in component.get("measures", [])}
-                coverage = float(measures.get("coverage", 100))
-                path = component["path"]
-                language = component.get("language") or infer_language(path)
-                if coverage < 100:  # Has uncovered lines
-                    uncovered_files.append({
-                        "path": path,
-                        "coverage": coverage,
-                        "uncovered_area": int(measures.get("uncovered_lines", 0)),
-                        "language": language,
-                    })
-
-            self.logger.info(f"Found {len(uncovered_files)} files with incomplete coverage")
+            with self._coverage_cache_lock:
+                page_cache = dict(self._coverage_cache.get(project_key, {}))
+
+            first_files, uncovered_total, total = await self._fetch_cached_page(
+                client, url, params, 1, page_cache
+            )
+            uncovered_files = list(first_files)
+
+            # Fetch the remaining pages concurrently, each revalidated by its own ETag
+            page_count = math.ceil(total / _PAGE_SIZE)
+            if page_count > 1:
+                pages = await asyncio.gather(*(
+                    self._fetch_cached_page(client, url, params, page, page_cache)
+                    for page in range(2, page_count + 1)
+                ))
+                for page_files, page_uncovered, _ in pages:
+                    uncovered_files.extend(page_files)
+                    uncovered_total += page_uncovered
+
+            # Pages past the end no longer exist
+            for page in [page for page in page_cache if page > max(page_count, 1)]:
+                del page_cache[page]
+            with self._coverage_cache_lock:
+                self._coverage_cache[project_key] = page_cache
+
+            self.logger.info("Found %s files with incomplete coverage", len(uncovered_files))
             return {
                 "uncovered_files": uncovered_files,
-                "uncovered_lines": sum(f["uncovered_area"] for f in uncovered_files),
+                "uncovered_lines": uncovered_total,
             }
-        except requests.RequestException as e:
-            self.logger.warning(f"Failed to fetch coverage details: {e}")
+        except httpx.HTTPError as e:
+            self.logger.warning("Failed to fetch coverage details: %s", e)
             # Return empty data rather than failing
             return {"uncovered_files": [], "uncovered_lines": 0}
+
+    async def _fetch_cached_page(
+        self,
+        client: "httpx.AsyncClient",
+        url: str,
+        params: Dict[str, Any],
+        page: int,
+        page_cache: Dict[int, Tuple[str, _PageData]],
+    ) -> _PageData:
+        """
+        Fetch one component_tree page, reusing the cached copy if it is unchanged.
+
+        Returns:
+            Tuple of (uncovered files, uncovered lines, paging total)
+        """
+        cached = page_cache.get(page)
+        headers = {"If-None-Match": cached[0]} if cached else None
+
+        response, files, uncovered, total = await self._fetch_component_page(
+            client, url, {**params, "p": page}, headers
+        )
+        if cached and response.status_code == 304:
+            self.logger.debug("Coverage page %s unchanged, using cached data", page)
+            return cached[1]
+
+        data = (files, uncovered, total)
+        etag = response.headers.get("ETag")
+        if etag:
+            page_cache[page] = (etag, data)
+        else:
+            page_cache.pop(page, None)
+        return data
+
+    async def _fetch_component_page(
+        self,
+        client: "httpx.AsyncClient",
+        url: str,
+        params: Dict[str, Any],
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Tuple["httpx.Response", List[Dict[str, Any]], int, int]:
+        """
+        Fetch one component_tree page, keeping only files with incomplete coverage.
+
+        With ijson installed the body is parsed incrementally as it arrives, so
+        fully covered components are discarded without materializing the page.
+
+        Returns:
+            Tuple of (response, uncovered files, uncovered lines, paging total)
+        """
+        async with client.stream("GET", url, params=params, headers=headers) as response:
+            if response.status_code == 304:
+                return response, [], 0, 0
+            response.raise_for_status()
+
+            if ijson is None:
+                data = _json_loads(await response.aread())
+                files, uncovered = _aggregate_components(data.get("components", []))
+                return response, files, uncovered, data.get("paging", {}).get("total", 0)
+
+            components = ijson.sendable_list()
+            paging_total = ijson.sendable_list()
+            components_parser = ijson.items_coro(components, "components.item")
+            paging_parser = ijson.items_coro(paging_total, "paging.total")
+            files: List[Dict[str, Any]] = []
+            uncovered = 0
+
+            def drain() -> None:
+                nonlocal uncovered
+                if components:
+                    page_files, page_uncovered = _aggregate_components(components)
+                    files.extend(page_files)
+                    uncovered += page_uncovered
+                    del components[:]
+
+            async for chunk in response.aiter_bytes():
+                components_parser.send(chunk)
+                paging_parser.send(chunk)
+                drain()
+            components_parser.close()
+            paging_parser.close()
+            drain()
+
+            return response, files, uncovered, int(paging_total[0]) if paging_total else 0
@@ -1,9 +1,174 @@
 """Test generation agent using LLM."""
+import ast
+import asyncio
+import functools
+import hashlib
+import os
+import re
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Tuple
+
+try:
+    import diskcache
+except ImportError:  # diskcache is optional; generation is uncached without it
+    diskcache = None
 
 from .base_agent import BaseAgent, AgentResult, AgentStatus, AgentError
-from ..llm import LLMFactory
+from ..llm.base import PromptSpec
+from ..llm.cache import bypass_cache
+from ..utils.helpers import run_async
+
+_PROMPT_FOOTER = """
+Generate comprehensive unit tests that cover:
+- Normal/happy path scenarios
+- Edge cases
+- Error handling
+- Different input types/values
+
+Output the complete test file content."""
+
+_SYSTEM_MESSAGE = """You are an expert {language} developer writing unit tests using {framework}.
+Generate comprehensive, well-structured unit tests that:
+1. Cover different scenarios (happy path, edge cases, error cases)
+2. Use appropriate fixtures and mocks where needed
+3. Follow {framework} best practices
+4. Include clear test names and docstrings
+5. Are syntactically correct and ready to run
+
+Output ONLY the test code, no explanations."""
+
+
+@functools.lru_cache(maxsize=128)
+def _read_text(path: str, mtime_ns: int) -> str:
+    """Read a file in one call; mtime_ns keys the cache so edits invalidate it."""
+    return Path(path).read_bytes().decode("utf-8", errors="replace")
+
+
+# Threads used to read candidate source files
+_READ_WORKERS = 8
+
+# Body of a markdown code fence: from the first opening fence to the last
+# closing run of the same backticks, or to the end of the text if the fence
+# is never closed. Fences may use more than three backticks.
+_CODE_FENCE = re.compile(r"(`{3,})[\w+-]*\n?(.*?)(?:\1(?:(?!\1).)*)?\Z", re.DOTALL)
+
+class _CodeFenceFilter:
+    """
+    Incrementally strip markdown code fences from streamed LLM output.
+
+    Produces the same text as ``_clean_generated_code`` on the full response
+    while only buffering what could still be a closing fence or trailing
+    whitespace.
+    """
+
+    def __init__(self):
+        self._state = "prefix"  # prefix -> fence -> tag -> body
+        self._buffer = ""
+        self._fence = "```"
+        self._started = False
+
+    def feed(self, chunk: str) -> str:
+        """Consume a chunk and return the text that is safe to emit."""
+        searched = max(len(self._buffer) - 2, 0)
+        self._buffer += chunk
+
+        if self._state == "prefix":
+            # Until a fence shows up the response may be unfenced code
+            start = self._buffer.find("```", searched)
+            if start == -1:
+                return ""
+            self._buffer = self._buffer[start:]
+            self._state = "fence"
+
+        if self._state == "fence":
+            # The closing fence repeats the opening run, which may be longer
+            # than three backticks and split across chunks
+            buffer = self._buffer
+            end = len(buffer) - len(buffer.lstrip("`"))
+            if end == len(buffer):
+                return ""
+            self._fence = buffer[:end]
+            self._buffer = buffer[end:]
+            self._state = "tag"
+
+        if self._state == "tag":
+            buffer = self._buffer
+            i = 0
+            while i < len(buffer) and (buffer[i].isalnum() or buffer[i] in "_+-"):
+                i += 1
+            if i == len(buffer):
+                return ""
+            if buffer[i] == "\n":
+                i += 1
+            self._buffer = buffer[i:]
+            self._state = "body"
+
+        # Hold back from the last fence (it may be the closing one) or any
+        # trailing backticks that could start one
+        buffer = self._buffer
+        hold = buffer.rfind(self._fence)
+        if hold == -1:
+            hold = len(buffer.rstrip("`"))
+        ready = buffer[:hold]
+        text = ready.rstrip()
+        self._buffer = ready[len(text):] + buffer[hold:]
+        if not self._started:
+            text = text.lstrip()
+            self._started = bool(text)
+        return text
+
+    def finish(self) -> str:
+        """Return any remaining text once the stream has ended."""
+        buffer, self._buffer = self._buffer, ""
+        if self._state == "prefix":
+            return buffer.strip()
+        if self._state in ("fence", "tag"):
+            return ""
+        end = buffer.rfind(self._fence)
+        if end != -1:
+            buffer = buffer[:end]
+        buffer = buffer.rstrip()
+        return buffer if self._started else buffer.lstrip()
+
+
+_FUNCTION_NODES = (ast.FunctionDef, ast.AsyncFunctionDef)
+
+
+@functools.lru_cache(maxsize=128)
+def _python_outline(path: str, mtime_ns: int) -> Tuple[str, Dict[str, str]]:
+    """
+    Split a Python file into its import header and per-function sources.
+
+    Args:
+        path: Source file path
+        mtime_ns: File modification time, used as part of the cache key
+
+    Returns:
+        Tuple of (import statements, mapping of qualified name to source)
+    """
+    source = _read_text(path, mtime_ns)
+    lines = source.splitlines(keepends=True)
+
+    def segment(node: ast.AST) -> str:
+        # Include decorators, which sit above the def line
+        start = min([node.lineno] + [d.lineno for d in getattr(node, "decorator_list", [])])
+        return "".join(lines[start - 1:node.end_lineno])
+
+    imports = []
+    functions = {}
+    for node in ast.parse(source).body:
+        if isinstance(node, (ast.Import, ast.ImportFrom)):
+            imports.append(segment(node))
+        elif isinstance(node, _FUNCTION_NODES):
+            functions[node.name] = segment(node)
+        elif isinstance(node, ast.ClassDef):
+            for child in node.body:
+                if isinstance(child, _FUNCTION_NODES):
+                    # Keep the enclosing class line so the method stays in context
+                    functions[f"{node.name}.{child.name}"] = f"class {node.name}:\n{segment(child)}"
+    return "".join(imports), functions
 
 
 class TestGeneratorAgent(BaseAgent):
@@ -14,6 +179,10 @@ class TestGeneratorAgent(BaseAgent):
         llm_provider,
         test_framework: str = "pytest",
         test_directory: str = "tests",
+        max_concurrent: int = 5,
+        use_cache: bool = True,
+        cache_dir: str = ".cache/testgen",
+        stream: bool = False,
         **kwargs: Any
     ):
         """
@@ -23,11 +192,23 @@ class TestGeneratorAgent(BaseAgent):
             llm_provider: LLM provider instance
             test_framework: Testing framework to use
             test_directory: Directory for test files
+            max_concurrent: Maximum number of concurrent LLM calls
+            use_cache: Reuse previously generated tests for unchanged sources;
+                when False the provider's response cache is bypassed as well
+            cache_dir: Directory of the on-disk generation cache
+            stream: Stream LLM output straight into test files when the
+                provider supports it (bypasses the generation cache)
         """
         super().__init__(**kwargs)
         self.llm = llm_provider
         self.test_framework = test_framework
         self.test_directory = test_directory
+        self.max_concurrent = max_concurrent
+        self.use_cache = use_cache
+        self._cache = diskcache.Cache(cache_dir) if use_cache and diskcache is not None else None
+        self._prompt_framework = f"Framework: {test_framework}\n\nSource Code:\n```"
+        self._system_messages: Dict[str, str] = {}
+        self._stream = stream and getattr(llm_provider, "supports_streaming", False)
 
     def execute(self, context: Dict[str, Any]) -> AgentResult:
         """
@@ -41,6 +222,36 @@ class TestGeneratorAgent(BaseAgent):
         Returns:
             AgentResult with generated tests
         """
+        return run_async(self.execute_async(context))
+
+    async def async_execute(self, context: Dict[str, Any]) -> AgentResult:
+        """Generate tests on the caller's event loop."""
+        return await self.execute_async(context)
+
+    async def execute_async(self, context: Dict[str, Any]) -> AgentResult:
+        """
+        Generate unit tests for candidates concurrently.
+
+        Prompts for all candidates are built first and sent in one
+        ``agenerate_batch`` call, whose concurrency is bounded by
+        ``max_concurrent``; test files are written in a second pass. With
+        streaming enabled each candidate streams into its file instead. A
+        failed candidate is reported in the results instead of aborting the
+        batch.
+
+        Args:
+            context: Same keys as ``execute``
+
+        Returns:
+            AgentResult with generated tests
+        """
+        if not self.use_cache:
+            with bypass_cache():
+                return await self._generate_tests(context)
+        return await self._generate_tests(context)
+
+    async def _generate_tests(self, context: Dict[str, Any]) -> AgentResult:
+        """Body of ``execute_async``, run inside the caching context."""
         self.validate_context(context, ["test_candidates", "repo_path"])
         
         test_candidates = context["test_candidates"]
@@ -50,95 +261,281 @@ class TestGeneratorAgent(BaseAgent):
         # Limit number of tests to generate
         candidates_to_process = test_candidates[:max_tests]
 
-        try:
-            generated_tests = []
-            test_files_created = []
-
-            for candidate in candidates_to_process:
-                self.logger.info(f"Generating test for: {candidate['name']}")
-                
-                # Read source code
-                source_code = self._read_source_code(candidate)
-                
-                # Generate test code
-                test_code = self._generate_test(candidate, source_code)
-                
-                # Write test file
-                test_file_path = self._write_test_file(
-                    repo_path,
-                    candidate,
-                    test_code
+        # Source roots as string prefixes, computed once for the whole batch
+        repo_root = os.path.join(os.path.normpath(str(repo_path)), "")
+        roots = (repo_root + "src" + os.sep, repo_root)
+
+        # Create all test directories up front rather than once per candidate
+        await asyncio.to_thread(self._ensure_test_directories, repo_path, candidates_to_process, roots)
+
+        if self._stream:
+            semaphore = asyncio.Semaphore(self.max_concurrent or 5)
+
+            async def stream_one(candidate: Dict[str, Any]) -> Path:
+                async with semaphore:
+                    self.logger.info("Generating test for: %s", candidate['name'])
+                    test_file_path = self._test_file_path(repo_path, candidate, roots)
+                    source_code = await asyncio.to_thread(self._read_source_code, candidate)
+                    return await asyncio.to_thread(
+                        self._stream_test_file, candidate, source_code, test_file_path
+                    )
+
+            results = await asyncio.gather(
+                *(stream_one(candidate) for candidate in candidates_to_process),
+                return_exceptions=True,
+            )
+        else:
+            results, pending = await asyncio.to_thread(
+                self._prepare_batch, repo_path, candidates_to_process, roots
+            )
+            if pending:
+                responses = await self.llm.agenerate_batch(
+                    [PromptSpec(item[2], item[3]) for item in pending],
+                    max_concurrency=self.max_concurrent or 5,
+                    return_exceptions=True,
                 )
-                
+                await asyncio.to_thread(self._write_batch, results, pending, responses)
+
+        generated_tests = []
+        test_files_created = []
+        failures = []
+        for candidate, result in zip(candidates_to_process, results):
+            if isinstance(result, BaseException):
+                self.logger.error("Test generation failed for %s: %s", candidate.get('name'), result)
+                failures.append(str(result))
                 generated_tests.append({
-                    "function": candidate["name"],
-                    "test_file": str(test_file_path),
-                    "success": True
+                    "function": candidate.get("name"),
+                    "error": str(result),
+                    "success": False
                 })
-                test_files_created.append(str(test_file_path))
-
-            self.logger.info(f"Generated {len(generated_tests)} test files")
-
-            return AgentResult(
-                status=AgentStatus.SUCCESS,
-                data={
-                    "generated_tests": generated_tests,
-                    "test_files": test_files_created,
-                    "total_generated": len(generated_tests),
-                },
-                metadata={"framework": self.test_framework}
-            )
-        except Exception as e:
-            self.logger.error(f"Test generation failed: {e}")
-            raise AgentError(f"Test generation error: {e}")
+                continue
+            generated_tests.append({
+                "function": candidate["name"],
+                "test_file": str(result),
+                "success": True
+            })
+            test_files_created.append(str(result))
+
+        if candidates_to_process and not test_files_created:
+            raise AgentError(f"Test generation error: {failures[0]}")
+
+        self.logger.info("Generated %s test files", len(test_files_created))
+
+        return AgentResult(
+            status=AgentStatus.SUCCESS,
+            data={
+                "generated_tests": generated_tests,
+                "test_files": test_files_created,
+                "total_generated": len(test_files_created),
+            },
+            metadata={"framework": self.test_framework, "failed": len(failures)}
+        )
 
     def _read_source_code(self, candidate: Dict[str, Any]) -> str:
         """Read source code for the function."""
-        file_path = Path(candidate["file_path"])
+        path = str(candidate["file_path"])
+        mtime_ns, source_code = self._load_source(path)
+        return self._slice_target_source(candidate, path, mtime_ns, source_code)
+
+    def _load_source(self, path: str) -> Tuple[int, str]:
+        """Read a source file, returning its (mtime_ns, contents)."""
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                return f.read()
+            mtime_ns = os.stat(path).st_mtime_ns
+            return mtime_ns, _read_text(path, mtime_ns)
         except Exception as e:
             raise AgentError(f"Failed to read source file: {e}")
 
-    def _generate_test(self, candidate: Dict[str, Any], source_code: str) -> str:
-        """Generate test code using LLM."""
+    def _read_sources(self, candidates: List[Dict[str, Any]]) -> List[Any]:
+        """
+        Read candidate sources in parallel, reading each distinct file once.
+
+        Args:
+            candidates: Test candidates
+
+        Returns:
+            Per-candidate source code, or the exception its read failed with
+        """
+        with ThreadPoolExecutor(max_workers=_READ_WORKERS) as executor:
+            reads = {}
+            for candidate in candidates:
+                path = str(candidate.get("file_path"))
+                if path not in reads:
+                    reads[path] = executor.submit(self._load_source, path)
+
+            sources: List[Any] = []
+            for candidate in candidates:
+                path = str(candidate.get("file_path"))
+                try:
+                    mtime_ns, source_code = reads[path].result()
+                    sources.append(self._slice_target_source(candidate, path, mtime_ns, source_code))
+                except Exception as e:
+                    sources.append(e)
+        return sources
+
+    def _slice_target_source(
+        self,
+        candidate: Dict[str, Any],
+        path: str,
+        mtime_ns: int,
+        source_code: str
+    ) -> str:
+        """
+        Narrow the source sent to the LLM to the target function.
+
+        Python functions are located by name via the AST and prefixed with
+        the module's imports; other candidates use start_line/end_line when
+        present. Falls back to the whole file.
+        """
         function_name = candidate.get("name")
-        is_method = candidate.get("is_method", False)
-        class_name = candidate.get("class_name")
+        if function_name and candidate.get("language", "python") == "python":
+            if candidate.get("is_method"):
+                function_name = f"{candidate.get('class_name')}.{function_name}"
+            try:
+                imports, functions = _python_outline(path, mtime_ns)
+            except (SyntaxError, ValueError):
+                return source_code
+            function_source = functions.get(function_name)
+            if function_source is not None:
+                return f"{imports}\n{function_source}" if imports else function_source
+
+        start_line = candidate.get("start_line")
+        end_line = candidate.get("end_line")
+        if start_line and end_line:
+            return "".join(source_code.splitlines(keepends=True)[start_line - 1:end_line])
+
+        return source_code
+
+    def _build_messages(self, candidate: Dict[str, Any], source_code: str) -> Tuple[str, str]:
+        """Build the (prompt, system message) pair for a candidate."""
         language = candidate.get("language", "python")
 
-        # Create prompt
         prompt = self._create_test_prompt(
-            function_name=function_name,
+            function_name=candidate.get("name"),
             source_code=source_code,
-            is_method=is_method,
-            class_name=class_name,
+            is_method=candidate.get("is_method", False),
+            class_name=candidate.get("class_name"),
             docstring=candidate.get("docstring"),
             language=language
         )
 
-        system_message = f"""You are an expert {language} developer writing unit tests using {self.test_framework}.
-Generate comprehensive, well-structured unit tests that:
-1. Cover different scenarios (happy path, edge cases, error cases)
-2. Use appropriate fixtures and mocks where needed
-3. Follow {self.test_framework} best practices
-4. Include clear test names and docstrings
-5. Are syntactically correct and ready to run
+        system_message = self._system_messages.get(language)
+        if system_message is None:
+            system_message = _SYSTEM_MESSAGE.format(language=language, framework=self.test_framework)
+            self._system_messages[language] = system_message
 
-Output ONLY the test code, no explanations."""
+        return prompt, system_message
 
-        try:
-            response = self.llm.generate(prompt, system_message=system_message)
-            test_code = response.content
+    def _cache_key(self, candidate: Dict[str, Any], source_code: str) -> Optional[str]:
+        """Key for the generation cache, or None when caching is disabled."""
+        if self._cache is None:
+            return None
+        model = getattr(self.llm, "config", {}).get("model", "")
+        language = candidate.get("language", "python")
+        return hashlib.blake2b(
+            f"{model}|{self.test_framework}|{language}|{candidate.get('class_name')}|{candidate.get('name')}|{source_code}".encode(),
+            digest_size=16,
+        ).hexdigest()
 
-            # Clean up the code (remove markdown code blocks if present)
-            test_code = self._clean_generated_code(test_code)
-            
-            return test_code
+    def _prepare_batch(
+        self,
+        repo_path: Path,
+        candidates: List[Dict[str, Any]],
+        roots: Tuple[str, str]
+    ) -> Tuple[List[Any], List[Tuple[int, Path, str, str, Optional[str]]]]:
+        """
+        Build prompts for all candidates, serving cache hits directly.
+
+        Args:
+            repo_path: Repository path
+            candidates: Test candidates
+            roots: (src root, repo root) string prefixes
+
+        Returns:
+            Tuple of (per-candidate results so far, pending generations). Results
+            hold a test file path, an exception, or None while still pending;
+            pending entries are (index, test_file_path, prompt, system_message, cache_key).
+        """
+        results: List[Any] = [None] * len(candidates)
+        pending = []  # (index, test_file_path, prompt, system_message, cache_key)
+
+        sources = self._read_sources(candidates)
+
+        # First pass: build prompts, serving cache hits directly
+        for index, (candidate, source_code) in enumerate(zip(candidates, sources)):
+            try:
+                self.logger.info("Generating test for: %s", candidate['name'])
+                test_file_path = self._test_file_path(repo_path, candidate, roots)
+                if isinstance(source_code, BaseException):
+                    raise source_code
+
+                cache_key = self._cache_key(candidate, source_code)
+                cached = self._cache.get(cache_key) if cache_key is not None else None
+                if cached is not None:
+                    self.logger.info("Using cached test for: %s", candidate.get("name"))
+                    results[index] = self._write_test_file(test_file_path, cached)
+                    continue
+
+                prompt, system_message = self._build_messages(candidate, source_code)
+                pending.append((index, test_file_path, prompt, system_message, cache_key))
+            except Exception as e:
+                results[index] = e
+
+        return results, pending
+
+    def _write_batch(
+        self,
+        results: List[Any],
+        pending: List[Tuple[int, Path, str, str, Optional[str]]],
+        responses: List[Any]
+    ) -> None:
+        """Clean, cache and write generated tests into their result slots."""
+        for (index, test_file_path, _, _, cache_key), response in zip(pending, responses):
+            if isinstance(response, BaseException):
+                results[index] = AgentError(f"LLM generation failed: {response}")
+                continue
+            try:
+                # Clean up the code (remove markdown code blocks if present)
+                test_code = self._clean_generated_code(response.content)
+                if cache_key is not None:
+                    self._cache.set(cache_key, test_code)
+                results[index] = self._write_test_file(test_file_path, test_code)
+            except Exception as e:
+                results[index] = e
+
+    def _stream_test_file(
+        self,
+        candidate: Dict[str, Any],
+        source_code: str,
+        test_file_path: Path
+    ) -> Path:
+        """Stream generated test code into the test file as it arrives."""
+        prompt, system_message = self._build_messages(candidate, source_code)
+        fence_filter = _CodeFenceFilter()
+
+        # Candidates from the same source file share a test file and stream
+        # concurrently, so each needs its own temp file
+        tmp_file = tempfile.NamedTemporaryFile(
+            "w",
+            encoding="utf-8",
+            dir=test_file_path.parent,
+            prefix=test_file_path.stem + ".",
+            suffix=".py.tmp",
+            delete=False,
+        )
+        tmp_path = Path(tmp_file.name)
+        try:
+            with tmp_file as f:
+                for chunk in self.llm.generate_stream(prompt, system_message=system_message):
+                    f.write(fence_filter.feed(chunk))
+                f.write(fence_filter.finish())
+            os.replace(tmp_path, test_file_path)
         except Exception as e:
+            tmp_path.unlink(missing_ok=True)
             raise AgentError(f"LLM generation failed: {e}")
 
+        self.logger.info("Created test file: %s", test_file_path)
+        return test_file_path
+
     def _create_test_prompt(
         self,
         function_name: str,
@@ -150,66 +547,80 @@ Output ONLY the test code, no explanations."""
     ) -> str:
         """Create prompt for test generation."""
         target = f"{class_name}.{function_name}" if is_method else function_name
-        prompt = f"""Generate unit tests for the following {language} code:
-
-Target: {target}
-Framework: {self.test_framework}
-
-Source Code:
-```{language}
-{source_code}
-```
-"""
+        prompt = (
+            f"Generate unit tests for the following {language} code:\n\nTarget: {target}\n"
+            + self._prompt_framework
+            + f"{language}\n{source_code}\n```\n"
+        )
         if docstring:
             prompt += f"\nDocstring: {docstring}\n"
-        prompt += f"""
-Generate comprehensive unit tests that cover:
-- Normal/happy path scenarios
-- Edge cases
-- Error handling
-- Different input types/values
-
-Output the complete test file content."""
-        return prompt
+        return prompt + _PROMPT_FOOTER
 
     def _clean_generated_code(self, code: str) -> str:
         """Clean generated code (remove markdown wrappers, etc.)."""
         # Remove markdown code blocks
-        if "```python" in code:
-            code = code.split("```python", 1)[1]
-            if "```" in code:
-                code = code.rsplit("```", 1)[0]
-        elif "```" in code:
-            code = code.split("```", 1)[1]
-            if "```" in code:
-                code = code.rsplit("```", 1)[0]
-        
-        return code.strip()
+        match = _CODE_FENCE.search(code)
+        return (match.group(2) if match else code).strip()
 
-    def _write_test_file(
+    def _test_file_path(
         self,
         repo_path: Path,
         candidate: Dict[str, Any],
-        test_code: str
+        roots: Tuple[str, str]
     ) -> Path:
-        """Write test code to file."""
-        # Determine test file path
-        source_file = Path(candidate["file_path"])
-        relative_path = source_file.relative_to(repo_path / "src") if "src" in source_file.parts else source_file.relative_to(repo_path)
+        """
+        Determine the test file path for a candidate.
+
+        Args:
+            repo_path: Repository path
+            candidate: Test candidate
+            roots: (src root, repo root) string prefixes, each ending in a separator
+
+        Returns:
+            Path of the test file, mirroring the source layout under src/
+        """
+        source_file = os.path.normpath(str(candidate["file_path"]))
+        for root in roots:
+            if source_file.startswith(root):
+                relative = source_file[len(root):]
+                break
+        else:
+            raise ValueError(f"{source_file} is not within {repo_path}")
         
         # Create test file name
-        test_file_name = f"test_{relative_path.stem}.py"
-        test_file_path = repo_path / self.test_directory / relative_path.parent / test_file_name
+        directory, file_name = os.path.split(relative)
+        test_file_name = f"test_{os.path.splitext(file_name)[0]}.py"
+        return repo_path / self.test_directory / directory / test_file_name
+
+    def _ensure_test_directories(
+        self,
+        repo_path: Path,
+        candidates: List[Dict[str, Any]],
+        roots: Tuple[str, str]
+    ) -> None:
+        """Create the unique test directories needed by the candidates."""
+        directories = set()
+        for candidate in candidates:
+            try:
+                directories.add(self._test_file_path(repo_path, candidate, roots).parent)
+            except ValueError:
+                # Reported for the candidate when its test file is written
+                continue
+        for directory in directories:
+            directory.mkdir(parents=True, exist_ok=True)
 
-        # Ensure directory exists
-        test_file_path.parent.mkdir(parents=True, exist_ok=True)
+    def _write_test_file(self, test_file_path: Path, test_code: str) -> Path:
+        """Write test code to file atomically."""
+        tmp_path = test_file_path.with_suffix(".py.tmp")
 
-        # Write test file
+        # Write to a temp file and rename so readers never see a partial file
         try:
-            with open(test_file_path, "w", encoding="utf-8") as f:
-                f.write(test_code)
+            with open(tmp_path, "wb", buffering=1024 * 1024) as f:
+                f.write(test_code.encode("utf-8"))
+            os.replace(tmp_path, test_file_path)
             
-            self.logger.info(f"Created test file: {test_file_path}")
+            self.logger.info("Created test file: %s", test_file_path)
             return test_file_path
         except Exception as e:
+            tmp_path.unlink(missing_ok=True)
             raise AgentError(f"Failed to write test file: {e}")
@@ -1,6 +1,9 @@
 """FastAPI application."""
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from .routes import workflow, status
 from ..config import get_settings
@@ -12,6 +15,22 @@ logger = setup_logger("api", level="INFO")
 # Get settings
 settings = get_settings()
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Application lifespan: owns resources shared across requests."""
+    logger.info("Starting Code Coverage Agent API")
+    logger.info("API running on %s:%s", settings.api.host, settings.api.port)
+
+    await workflow.startup()
+    try:
+        yield
+    finally:
+        await workflow.shutdown()
+
+    logger.info("Shutting down Code Coverage Agent API")
+
+
 # Create FastAPI app
 app = FastAPI(
     title="Code Coverage Agent API",
@@ -19,6 +38,8 @@ app = FastAPI(
     version="0.1.0",
     docs_url="/docs" if settings.api.enable_docs else None,
     redoc_url="/redoc" if settings.api.enable_docs else None,
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # Add CORS middleware
@@ -35,19 +56,6 @@ app.include_router(workflow.router, prefix="/api")
 app.include_router(status.router, prefix="/api")
 
 
-@app.on_event("startup")
-async def startup_event():
-    """Startup event handler."""
-    logger.info("Starting Code Coverage Agent API")
-    logger.info(f"API running on {settings.api.host}:{settings.api.port}")
-
-
-@app.on_event("shutdown")
-async def shutdown_event():
-    """Shutdown event handler."""
-    logger.info("Shutting down Code Coverage Agent API")
-
-
 # Root endpoint
 @app.get("/")
 async def root():
@@ -1,6 +1,6 @@
 """FastAPI request/response models."""
 from typing import List, Optional, Dict, Any
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from enum import Enum
 
 
@@ -21,6 +21,8 @@ class WorkflowStartRequest(BaseModel):
 
 class WorkflowStatusResponse(BaseModel):
     """Workflow status response."""
+    model_config = ConfigDict(extra="ignore", validate_assignment=False)
+
     workflow_id: str
     status: WorkflowStatus
     current_step: Optional[str] = None
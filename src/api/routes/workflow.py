@@ -1,24 +1,80 @@
 """Workflow API routes."""
-from fastapi import APIRouter, HTTPException, BackgroundTasks
+from fastapi import APIRouter, HTTPException, BackgroundTasks, Query, Response
+from fastapi.responses import StreamingResponse
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from typing import Any, Dict, Literal, Set
+import asyncio
 import uuid
-from typing import Dict
+
+import orjson
 
 from ..models import WorkflowStartRequest, WorkflowStartResponse, WorkflowStatusResponse, WorkflowStatus
+from ..store import WorkflowStore
+from ...config import get_settings
 from ...workflow import compiled_workflow
 from ...utils.logger import get_logger
 
 router = APIRouter(prefix="/workflow", tags=["workflow"])
 logger = get_logger(__name__)
 
-# In-memory workflow tracking (in production, use database)
-workflows: Dict[str, Dict] = {}
+settings = get_settings()
+
+# Persistent workflow tracking
+store = WorkflowStore(settings.api.database_path)
+
+# Workflows run on worker threads so they don't block the event loop;
+# the pool size enforces the max_concurrent_workflows ceiling
+_executor = ThreadPoolExecutor(
+    max_workers=settings.api.max_concurrent_workflows,
+    thread_name_prefix="workflow",
+)
+
+# Per-workflow queues of connected status streams
+_subscribers: Dict[str, Set[asyncio.Queue]] = defaultdict(set)
+
+_TERMINAL_STATUSES = frozenset({WorkflowStatus.SUCCESS.value, WorkflowStatus.FAILED.value})
+
+# Seconds between keep-alive comments on an idle status stream
+_STREAM_KEEPALIVE_S = 15.0
+
+
+def _publish(workflow_id: str, event: Dict[str, Any]) -> None:
+    """Push a status update to every stream watching a workflow."""
+    for queue in _subscribers.get(workflow_id, ()):
+        queue.put_nowait(event)
+
+
+def _run_workflow(workflow_id: str, initial_state: Dict[str, Any], loop: asyncio.AbstractEventLoop) -> Dict[str, Any]:
+    """Run the graph on a worker thread, publishing the state after each step."""
+    result = initial_state
+    for state in compiled_workflow.stream(initial_state, stream_mode="values"):
+        result = state
+        loop.call_soon_threadsafe(_publish, workflow_id, {
+            "status": WorkflowStatus.RUNNING.value,
+            "current_step": state.get("current_step"),
+            "coverage_before": state.get("coverage_before"),
+        })
+    return result
+
+
+async def startup() -> None:
+    """Open resources shared by the workflow routes."""
+    await store.open()
+
+
+async def shutdown() -> None:
+    """Stop accepting workflow runs and release shared resources."""
+    _executor.shutdown(wait=False, cancel_futures=True)
+    await store.close()
 
 
 async def run_workflow_background(workflow_id: str, request: WorkflowStartRequest):
     """Run workflow in background."""
     try:
-        workflows[workflow_id]["status"] = WorkflowStatus.RUNNING
+        await store.update(workflow_id, status=WorkflowStatus.RUNNING)
+        _publish(workflow_id, {"status": WorkflowStatus.RUNNING.value})
         
         initial_state = {
             "repo_url": request.repo_url,
@@ -29,26 +85,34 @@ async def run_workflow_background(workflow_id: str, request: WorkflowStartReques
             "errors": [],
         }
         
-        logger.info(f"Starting workflow {workflow_id}")
-        result = compiled_workflow.invoke(initial_state)
+        logger.info("Starting workflow %s", workflow_id)
+        loop = asyncio.get_running_loop()
+        result = await loop.run_in_executor(_executor, _run_workflow, workflow_id, initial_state, loop)
         
         # Update workflow status
-        workflows[workflow_id].update({
-            "status": WorkflowStatus.SUCCESS if result.get("status") != "failed" else WorkflowStatus.FAILED,
+        status = WorkflowStatus.SUCCESS if result.get("status") != "failed" else WorkflowStatus.FAILED
+        await store.update(
+            workflow_id,
+            status=status,
+            current_step=result.get("current_step"),
+            coverage_before=result.get("coverage_before"),
+            pr_url=result.get("pr_url"),
+            errors=result.get("errors", []),
+            result=result,
+        )
+        _publish(workflow_id, {
+            "status": status.value,
             "current_step": result.get("current_step"),
             "coverage_before": result.get("coverage_before"),
             "pr_url": result.get("pr_url"),
             "errors": result.get("errors", []),
-            "result": result,
         })
         
-        logger.info(f"Workflow {workflow_id} completed with status: {workflows[workflow_id]['status']}")
+        logger.info("Workflow %s completed with status: %s", workflow_id, status.value)
     except Exception as e:
-        logger.error(f"Workflow {workflow_id} failed: {e}")
-        workflows[workflow_id].update({
-            "status": WorkflowStatus.FAILED,
-            "errors": [str(e)],
-        })
+        logger.error("Workflow %s failed: %s", workflow_id, e)
+        await store.update(workflow_id, status=WorkflowStatus.FAILED, errors=[str(e)])
+        _publish(workflow_id, {"status": WorkflowStatus.FAILED.value, "errors": [str(e)]})
 
 
 @router.post("/start", response_model=WorkflowStartResponse)
@@ -57,57 +121,126 @@ async def start_workflow(request: WorkflowStartRequest, background_tasks: Backgr
     workflow_id = str(uuid.uuid4())
     
     # Initialize workflow tracking
-    workflows[workflow_id] = {
+    await store.create({
         "workflow_id": workflow_id,
         "status": WorkflowStatus.PENDING,
         "created_at": datetime.now().isoformat(),
-        "request": request.dict(),
-    }
+        "request": request.model_dump(mode="json"),
+    })
     
     # Run workflow in background
     background_tasks.add_task(run_workflow_background, workflow_id, request)
     
-    return WorkflowStartResponse(
+    response = WorkflowStartResponse(
         workflow_id=workflow_id,
         status=WorkflowStatus.PENDING,
         message="Workflow started successfully"
     )
+    # Serialize directly, skipping FastAPI's jsonable_encoder pass
+    return Response(content=response.model_dump_json(), media_type="application/json")
 
 
 @router.get("/{workflow_id}", response_model=WorkflowStatusResponse)
 async def get_workflow_status(workflow_id: str):
     """Get workflow status."""
-    if workflow_id not in workflows:
+    workflow = await store.get(workflow_id)
+    if workflow is None:
         raise HTTPException(status_code=404, detail="Workflow not found")
     
-    workflow = workflows[workflow_id]
-    
-    return WorkflowStatusResponse(
+    # Stored data was validated on the way in; skip re-validation per poll
+    response = WorkflowStatusResponse.model_construct(
         workflow_id=workflow_id,
-        status=workflow["status"],
+        status=WorkflowStatus(workflow["status"]),
         current_step=workflow.get("current_step"),
         coverage_before=workflow.get("coverage_before"),
         pr_url=workflow.get("pr_url"),
         errors=workflow.get("errors", []),
         created_at=workflow["created_at"],
     )
+    return Response(content=response.model_dump_json(), media_type="application/json")
+
+
+@router.get("/{workflow_id}/stream")
+async def stream_workflow_status(workflow_id: str):
+    """Stream workflow status updates as server-sent events."""
+    # Subscribe before reading the snapshot so no update falls in between
+    queue: asyncio.Queue = asyncio.Queue()
+    _subscribers[workflow_id].add(queue)
+
+    workflow = await store.get(workflow_id)
+    if workflow is None:
+        _unsubscribe(workflow_id, queue)
+        raise HTTPException(status_code=404, detail="Workflow not found")
+
+    async def events():
+        try:
+            snapshot = {
+                "workflow_id": workflow_id,
+                "status": workflow["status"],
+                "current_step": workflow.get("current_step"),
+                "coverage_before": workflow.get("coverage_before"),
+                "pr_url": workflow.get("pr_url"),
+                "errors": workflow.get("errors", []),
+            }
+            yield _sse_frame(snapshot)
+            if snapshot["status"] in _TERMINAL_STATUSES:
+                return
+
+            while True:
+                try:
+                    event = await asyncio.wait_for(queue.get(), _STREAM_KEEPALIVE_S)
+                except asyncio.TimeoutError:
+                    yield b": keep-alive\n\n"
+                    continue
+                yield _sse_frame(event)
+                if event.get("status") in _TERMINAL_STATUSES:
+                    return
+        finally:
+            _unsubscribe(workflow_id, queue)
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+def _sse_frame(event: Dict[str, Any]) -> bytes:
+    """Encode a status update as a server-sent event frame."""
+    return b"event: status\ndata: " + orjson.dumps(event) + b"\n\n"
+
+
+def _unsubscribe(workflow_id: str, queue: asyncio.Queue) -> None:
+    """Detach a stream's queue, dropping the workflow entry once unwatched."""
+    queues = _subscribers.get(workflow_id)
+    if queues is None:
+        return
+    queues.discard(queue)
+    if not queues:
+        del _subscribers[workflow_id]
 
 
 @router.post("/{workflow_id}/cancel")
 async def cancel_workflow(workflow_id: str):
     """Cancel a running workflow."""
-    if workflow_id not in workflows:
-        raise HTTPException(status_code=404, detail="Workflow not found")
-    
     # In a real implementation, you'd need to implement cancellation logic
     # For now, just mark as failed
-    workflows[workflow_id]["status"] = WorkflowStatus.FAILED
-    workflows[workflow_id]["errors"] = ["Cancelled by user"]
+    workflow = await store.update(
+        workflow_id, status=WorkflowStatus.FAILED, errors=["Cancelled by user"]
+    )
+    if workflow is None:
+        raise HTTPException(status_code=404, detail="Workflow not found")
+    _publish(workflow_id, {"status": WorkflowStatus.FAILED.value, "errors": ["Cancelled by user"]})
     
     return {"message": "Workflow cancelled"}
 
 
 @router.get("/")
-async def list_workflows():
-    """List all workflows."""
-    return {"workflows": list(workflows.values())}
+async def list_workflows(
+    limit: int = Query(default=100, ge=1, le=1000),
+    offset: int = Query(default=0, ge=0),
+    order: Literal["asc", "desc"] = Query(default="asc"),
+):
+    """List workflows by creation time, paginated."""
+    workflows = await store.list(limit=limit, offset=offset, descending=order == "desc")
+    return {"workflows": workflows}
@@ -0,0 +1,175 @@
+"""Persistent workflow store backed by SQLite."""
+import asyncio
+import json
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+import aiosqlite
+
+from ..utils.helpers import ensure_directory
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS workflows (
+    id TEXT PRIMARY KEY,
+    status TEXT NOT NULL,
+    payload JSON NOT NULL,
+    created_at TEXT NOT NULL
+)
+"""
+
+_CREATED_AT_INDEX = "CREATE INDEX IF NOT EXISTS idx_workflows_created_at ON workflows (created_at)"
+
+
+class WorkflowStore:
+    """
+    Async-safe workflow tracking persisted in SQLite.
+
+    Call ``open`` to keep one connection for the store's lifetime (the API
+    does this in its lifespan); otherwise each call opens its own.
+    """
+
+    def __init__(self, db_path: str = "data/workflows.db"):
+        """
+        Initialize workflow store.
+
+        Args:
+            db_path: Path to the SQLite database file
+        """
+        self.db_path = Path(db_path)
+        self._initialized = False
+        self._conn: Optional[aiosqlite.Connection] = None
+        self._lock: Optional[asyncio.Lock] = None
+
+    async def open(self) -> None:
+        """Open the shared connection used by all subsequent calls."""
+        if self._conn is not None:
+            return
+        ensure_directory(self.db_path.parent)
+        conn = await aiosqlite.connect(self.db_path)
+        await self._ensure_schema(conn)
+        self._lock = asyncio.Lock()
+        self._conn = conn
+
+    async def close(self) -> None:
+        """Close the shared connection; later calls fall back to their own."""
+        conn, self._conn = self._conn, None
+        if conn is not None:
+            await conn.close()
+
+    async def _ensure_schema(self, conn: aiosqlite.Connection) -> None:
+        """Create the schema on first use."""
+        if self._initialized:
+            return
+        await conn.execute(_SCHEMA)
+        await conn.execute(_CREATED_AT_INDEX)
+        await conn.commit()
+        self._initialized = True
+
+    @asynccontextmanager
+    async def _connect(self) -> AsyncIterator[aiosqlite.Connection]:
+        """Yield the shared connection, or a temporary one if the store isn't open."""
+        if self._conn is not None:
+            # One operation at a time, so transactions don't interleave
+            async with self._lock:
+                yield self._conn
+            return
+
+        ensure_directory(self.db_path.parent)
+        async with aiosqlite.connect(self.db_path) as conn:
+            await self._ensure_schema(conn)
+            yield conn
+
+    async def create(self, workflow: Dict[str, Any]) -> None:
+        """
+        Insert a new workflow record.
+
+        Args:
+            workflow: Workflow data; must contain workflow_id, status and created_at
+        """
+        async with self._connect() as conn:
+            await conn.execute(
+                "INSERT INTO workflows (id, status, payload, created_at) VALUES (?, ?, ?, ?)",
+                (
+                    workflow["workflow_id"],
+                    workflow["status"],
+                    json.dumps(workflow, default=str),
+                    workflow["created_at"],
+                ),
+            )
+            await conn.commit()
+
+    async def get(self, workflow_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Fetch a workflow by ID.
+
+        Args:
+            workflow_id: Workflow ID
+
+        Returns:
+            Workflow data, or None if not found
+        """
+        async with self._connect() as conn:
+            async with conn.execute(
+                "SELECT payload FROM workflows WHERE id = ?", (workflow_id,)
+            ) as cursor:
+                row = await cursor.fetchone()
+        return json.loads(row[0]) if row else None
+
+    async def update(self, workflow_id: str, **fields: Any) -> Optional[Dict[str, Any]]:
+        """
+        Merge fields into a workflow record atomically.
+
+        Args:
+            workflow_id: Workflow ID
+            **fields: Fields to update
+
+        Returns:
+            Updated workflow data, or None if not found
+        """
+        async with self._connect() as conn:
+            # BEGIN IMMEDIATE takes the write lock before the read-modify-write
+            await conn.execute("BEGIN IMMEDIATE")
+            async with conn.execute(
+                "SELECT payload FROM workflows WHERE id = ?", (workflow_id,)
+            ) as cursor:
+                row = await cursor.fetchone()
+            if row is None:
+                await conn.rollback()
+                return None
+
+            workflow = json.loads(row[0])
+            workflow.update(fields)
+            await conn.execute(
+                "UPDATE workflows SET status = ?, payload = ? WHERE id = ?",
+                (workflow["status"], json.dumps(workflow, default=str), workflow_id),
+            )
+            await conn.commit()
+        return workflow
+
+    async def list(
+        self,
+        limit: int = 100,
+        offset: int = 0,
+        descending: bool = False,
+    ) -> List[Dict[str, Any]]:
+        """
+        List workflows in creation order.
+
+        Args:
+            limit: Maximum number of workflows to return
+            offset: Number of workflows to skip
+            descending: Return the newest workflows first
+
+        Returns:
+            List of workflow data
+        """
+        query = (
+            "SELECT payload FROM workflows ORDER BY created_at DESC LIMIT ? OFFSET ?"
+            if descending
+            else "SELECT payload FROM workflows ORDER BY created_at LIMIT ? OFFSET ?"
+        )
+        async with self._connect() as conn:
+            async with conn.execute(query, (limit, offset)) as cursor:
+                rows = await cursor.fetchall()
+        return [json.loads(row[0]) for row in rows]
@@ -1,5 +1,5 @@
 """Configuration package."""
-from .settings import get_settings, load_settings, ConfigurationError
+from .settings import configure, get_settings, load_settings, ConfigurationError
 from .schema import Settings
 
-__all__ = ["get_settings", "load_settings", "ConfigurationError", "Settings"]
+__all__ = ["configure", "get_settings", "load_settings", "ConfigurationError", "Settings"]
@@ -1,7 +1,7 @@
 """Configuration schema using Pydantic models."""
 from enum import Enum
 from typing import List, Optional, Dict, Any
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 
 class GitProvider(str, Enum):
@@ -53,11 +53,19 @@ class AzureOpenAIConfig(BaseModel):
 
 class LLMConfig(BaseModel):
     """LLM configuration."""
+    model_config = ConfigDict(frozen=True)
+
     provider: LLMProvider = LLMProvider.OPENAI
     model: str = Field(default="gpt-4", description="Model name")
     api_key: str = Field(..., description="API key for the provider")
     temperature: float = Field(default=0.2, ge=0.0, le=2.0)
     max_tokens: int = Field(default=4000, gt=0)
+    max_concurrency: int = Field(default=5, gt=0, description="Maximum concurrent LLM requests")
+    cache_enabled: bool = Field(default=True, description="Cache responses on disk")
+    latency_budget_ms: int = Field(default=0, ge=0, description="Acceptable latency for batched generation")
+    batch_sync_threshold_ms: int = Field(default=300000, gt=0, description="Budget above which the Batch API is used")
+    rate_limit_rpm: int = Field(default=0, ge=0, description="Requests per minute (0 = unlimited)")
+    rate_limit_tpm: int = Field(default=0, ge=0, description="Prompt tokens per minute (0 = unlimited)")
     azure_openai: Optional[AzureOpenAIConfig] = None
 
 
@@ -92,6 +100,7 @@ class TestGenerationConfig(BaseModel):
     include_mocks: bool = True
     test_file_pattern: str = "test_{module}.py"
     test_directory: str = "tests"
+    stream: bool = Field(default=False, description="Stream LLM output straight into test files")
 
 
 class APIConfig(BaseModel):
@@ -101,6 +110,7 @@ class APIConfig(BaseModel):
     cors_origins: List[str] = Field(default=["*"])
     enable_docs: bool = True
     max_concurrent_workflows: int = Field(default=5, gt=0)
+    database_path: str = "data/workflows.db"
 
 
 class UIConfig(BaseModel):
@@ -142,6 +152,4 @@ class Settings(BaseModel):
     ui: UIConfig = Field(default_factory=UIConfig)
     logging: LoggingConfig = Field(default_factory=LoggingConfig)
 
-    class Config:
-        """Pydantic config."""
-        use_enum_values = True
+    model_config = ConfigDict(use_enum_values=True)
@@ -1,5 +1,7 @@
 """Settings loader and configuration management."""
+import functools
 import os
+import re
 from pathlib import Path
 from typing import Any, Dict, Optional
 import yaml
@@ -9,49 +11,73 @@ from pydantic import ValidationError
 from .schema import Settings
 from src.utils.logger import get_logger
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # libyaml not available
+    from yaml import SafeLoader
+
 logger = get_logger(__name__)
 
 
+# Matches ${VAR_NAME} and ${VAR_NAME:default_value}
+_ENV_VAR_PATTERN = re.compile(r"\$\{([^:}]+)(?::([^}]*))?\}")
+
+
 class ConfigurationError(Exception):
     """Raised when configuration is invalid or missing."""
     pass
 
 
-def substitute_env_vars(config: Dict[str, Any]) -> Dict[str, Any]:
+def _substitute_match(match: "re.Match[str]") -> str:
+    """Resolve a single ${VAR} or ${VAR:default} match."""
+    var_name, default_value = match.group(1), match.group(2)
+    value = os.environ.get(var_name, default_value)
+    if value is None:
+        raise ConfigurationError(
+            f"Environment variable {var_name} is required but not set"
+        )
+    return value
+
+
+def _substitute_string(value: str) -> str:
+    """Substitute every environment variable reference in a string."""
+    # Most values are literals; skip the regex engine for them
+    if "${" not in value:
+        return value
+    return _ENV_VAR_PATTERN.sub(_substitute_match, value)
+
+
+def substitute_env_vars(config: Any) -> Any:
     """
-    Recursively substitute environment variables in configuration values.
+    Substitute environment variables in configuration values in place.
 
-    Supports ${VAR_NAME} and ${VAR_NAME:default_value} syntax.
+    Supports ${VAR_NAME} and ${VAR_NAME:default_value} syntax, including
+    multiple references within a single value.
 
     Args:
-        config: Configuration dictionary
+        config: Configuration dictionary, list or scalar
 
     Returns:
-        Configuration with environment variables substituted
+        Configuration with environment variables substituted; other scalars
+        are returned unchanged
     """
-    if isinstance(config, dict):
-        return {k: substitute_env_vars(v) for k, v in config.items()}
-    elif isinstance(config, list):
-        return [substitute_env_vars(item) for item in config]
-    elif isinstance(config, str):
-        # Handle ${VAR_NAME} or ${VAR_NAME:default}
-        if config.startswith("${") and config.endswith("}"):
-            var_spec = config[2:-1]
-            if ":" in var_spec:
-                var_name, default_value = var_spec.split(":", 1)
-                return os.getenv(var_name, default_value)
-            else:
-                var_name = var_spec
-                value = os.getenv(var_name)
-                if value is None:
-                    raise ConfigurationError(
-                        f"Environment variable {var_name} is required but not set"
-                    )
-                return value
-        return config
-    else:
+    if isinstance(config, str):
+        return _substitute_string(config)
+    if not isinstance(config, (dict, list)):
+        # Numbers, booleans and None have nothing to substitute
         return config
 
+    stack = [config]
+    while stack:
+        container = stack.pop()
+        items = container.items() if isinstance(container, dict) else enumerate(container)
+        for key, value in items:
+            if isinstance(value, str):
+                container[key] = _substitute_string(value)
+            elif isinstance(value, (dict, list)):
+                stack.append(value)
+    return config
+
 
 def load_yaml_config(config_path: Path) -> Dict[str, Any]:
     """
@@ -70,8 +96,8 @@ def load_yaml_config(config_path: Path) -> Dict[str, Any]:
         raise ConfigurationError(f"Configuration file not found: {config_path}")
 
     try:
-        with open(config_path, "r") as f:
-            config = yaml.safe_load(f)
+        with open(config_path, "rb") as f:
+            config = yaml.load(f, Loader=SafeLoader)
         return config if config else {}
     except yaml.YAMLError as e:
         raise ConfigurationError(f"Invalid YAML in {config_path}: {e}")
@@ -100,15 +126,15 @@ def load_settings(
     
     if env_file.exists():
         load_dotenv(env_file)
-        logger.info(f"Loaded environment variables from {env_file}")
+        logger.info("Loaded environment variables from %s", env_file)
     else:
-        logger.warning(f"Environment file not found: {env_file}")
+        logger.warning("Environment file not found: %s", env_file)
 
     # Load YAML configuration
     if config_path is None:
         config_path = Path("config/default.yaml")
 
-    logger.info(f"Loading configuration from {config_path}")
+    logger.info("Loading configuration from %s", config_path)
     config_dict = load_yaml_config(config_path)
 
     # Substitute environment variables
@@ -120,33 +146,44 @@ def load_settings(
         logger.info("Configuration loaded and validated successfully")
         return settings
     except ValidationError as e:
-        logger.error(f"Configuration validation failed: {e}")
+        logger.error("Configuration validation failed: %s", e)
         raise ConfigurationError(f"Invalid configuration: {e}")
 
 
-# Global settings instance (lazy loaded)
-_settings: Optional[Settings] = None
+# Paths used by get_settings; override with configure() before first access
+_config_path: Optional[Path] = None
+_env_file: Optional[Path] = None
 
 
-def get_settings(
+def configure(
     config_path: Optional[Path] = None,
     env_file: Optional[Path] = None,
-    reload: bool = False,
-) -> Settings:
+) -> None:
     """
-    Get the global settings instance.
+    Set the configuration paths used by get_settings.
+
+    Clears any cached settings so the next get_settings call reloads them.
 
     Args:
         config_path: Path to YAML configuration file
         env_file: Path to .env file
-        reload: Force reload of settings
+    """
+    global _config_path, _env_file
+
+    _config_path = config_path
+    _env_file = env_file
+    get_settings.cache_clear()
+
+
+@functools.lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Get the global settings instance.
+
+    Settings are loaded once and cached; call get_settings.cache_clear()
+    to force a reload.
 
     Returns:
         Settings instance
     """
-    global _settings
-    
-    if _settings is None or reload:
-        _settings = load_settings(config_path, env_file)
-    
-    return _settings
+    return load_settings(_config_path, _env_file)
@@ -1,5 +1,6 @@
 """LLM service package."""
-from .base import BaseLLMProvider, LLMResponse, LLMError
+from .base import BaseLLMProvider, LLMResponse, LLMError, PromptSpec
+from .batch_dispatcher import FleetDispatcher
 from .factory import LLMFactory
 
-__all__ = ["BaseLLMProvider", "LLMResponse", "LLMError", "LLMFactory"]
+__all__ = ["BaseLLMProvider", "LLMResponse", "LLMError", "PromptSpec", "FleetDispatcher", "LLMFactory"]
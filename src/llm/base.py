@@ -1,20 +1,35 @@
 """Base interface for LLM providers."""
+import asyncio
+import json
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional
-from pydantic import BaseModel
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterator, List, NamedTuple, Optional, Union
+from pydantic import BaseModel, ConfigDict
 
 
 class LLMResponse(BaseModel):
     """Standard LLM response format."""
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     content: str
     model: str
     usage: Optional[Dict[str, int]] = None
     metadata: Optional[Dict[str, Any]] = None
 
 
+class PromptSpec(NamedTuple):
+    """A single request in a batched generation."""
+    prompt: str
+    system_message: Optional[str] = None
+    schema: Optional[Dict[str, Any]] = None
+
+
 class BaseLLMProvider(ABC):
     """Abstract base class for LLM providers."""
 
+    # Whether generate_stream yields incrementally rather than all at once
+    supports_streaming: bool = False
+
     def __init__(self, **kwargs: Any):
         """
         Initialize the LLM provider.
@@ -47,6 +62,143 @@ class BaseLLMProvider(ABC):
         """
         pass
 
+    async def agenerate(
+        self,
+        prompt: str,
+        system_message: Optional[str] = None,
+        **kwargs: Any
+    ) -> LLMResponse:
+        """
+        Generate text from a prompt without blocking the event loop.
+
+        The default implementation runs ``generate`` in a worker thread;
+        providers with a native async client override this.
+
+        Args:
+            prompt: The input prompt
+            system_message: Optional system message for context
+            **kwargs: Additional provider-specific parameters
+
+        Returns:
+            LLMResponse containing the generated text
+
+        Raises:
+            LLMError: If generation fails
+        """
+        return await asyncio.to_thread(self.generate, prompt, system_message=system_message, **kwargs)
+
+    def generate_stream(
+        self,
+        prompt: str,
+        system_message: Optional[str] = None,
+        **kwargs: Any
+    ) -> Iterator[str]:
+        """
+        Generate text from a prompt, yielding chunks as they arrive.
+
+        The default implementation yields the full ``generate`` result once;
+        providers that can stream override this and set ``supports_streaming``.
+
+        Args:
+            prompt: The input prompt
+            system_message: Optional system message for context
+            **kwargs: Additional provider-specific parameters
+
+        Yields:
+            Chunks of generated text
+
+        Raises:
+            LLMError: If generation fails
+        """
+        yield self.generate(prompt, system_message=system_message, **kwargs).content
+
+    def generate_batch(
+        self,
+        specs: List[PromptSpec],
+        max_concurrency: int = 5,
+        return_exceptions: bool = False
+    ) -> List[Union[LLMResponse, Exception]]:
+        """
+        Generate responses for a batch of prompt specs.
+
+        Specs with a schema are answered via ``generate_with_schema`` and their
+        structured output is returned as JSON in the response content. The
+        default implementation runs requests concurrently on a thread pool;
+        providers with a native batch interface or batch service override this.
+
+        Args:
+            specs: Requests to generate
+            max_concurrency: Maximum number of requests in flight
+            return_exceptions: Return per-spec exceptions instead of raising
+
+        Returns:
+            LLMResponse (or exception, if return_exceptions) per spec, in order
+        """
+        def generate_spec(spec: PromptSpec) -> LLMResponse:
+            if spec.schema is None:
+                return self.generate(spec.prompt, system_message=spec.system_message)
+            result = self.generate_with_schema(spec.prompt, spec.schema, system_message=spec.system_message)
+            return LLMResponse(content=json.dumps(result), model=self.config.get("model", ""))
+
+        return self._map_concurrently(
+            generate_spec,
+            specs,
+            max_concurrency=max_concurrency,
+            return_exceptions=return_exceptions,
+        )
+
+    async def agenerate_batch(
+        self,
+        specs: List[PromptSpec],
+        max_concurrency: int = 5,
+        return_exceptions: bool = False
+    ) -> List[Union[LLMResponse, Exception]]:
+        """
+        Async variant of ``generate_batch`` bounded by a semaphore.
+
+        Args:
+            specs: Requests to generate
+            max_concurrency: Maximum number of requests in flight
+            return_exceptions: Return per-spec exceptions instead of raising
+
+        Returns:
+            LLMResponse (or exception, if return_exceptions) per spec, in order
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def generate_spec(spec: PromptSpec) -> LLMResponse:
+            async with semaphore:
+                if spec.schema is None:
+                    return await self.agenerate(spec.prompt, system_message=spec.system_message)
+                result = await asyncio.to_thread(
+                    self.generate_with_schema, spec.prompt, spec.schema, system_message=spec.system_message
+                )
+                return LLMResponse(content=json.dumps(result), model=self.config.get("model", ""))
+
+        return await asyncio.gather(
+            *(generate_spec(spec) for spec in specs),
+            return_exceptions=return_exceptions,
+        )
+
+    @staticmethod
+    def _map_concurrently(
+        func: Callable[..., LLMResponse],
+        *iterables: List[Any],
+        max_concurrency: int,
+        return_exceptions: bool
+    ) -> List[Union[LLMResponse, Exception]]:
+        """Apply func across iterables on a thread pool, preserving order."""
+        def call(*args: Any) -> Union[LLMResponse, Exception]:
+            try:
+                return func(*args)
+            except Exception as e:
+                if not return_exceptions:
+                    raise
+                return e
+
+        with ThreadPoolExecutor(max_workers=max(1, min(max_concurrency, len(iterables[0])))) as executor:
+            return list(executor.map(call, *iterables))
+
     @abstractmethod
     def generate_with_schema(
         self,
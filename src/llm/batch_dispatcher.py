@@ -0,0 +1,257 @@
+"""Dispatcher that pools LLM requests into OpenAI Batch API jobs."""
+import asyncio
+import json
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
+
+from .base import LLMError, LLMResponse, PromptSpec
+from ..utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+_ENDPOINT = "/v1/chat/completions"
+_TERMINAL_STATUSES = frozenset({"completed", "failed", "expired", "cancelled"})
+_USAGE_KEYS = ("prompt_tokens", "completion_tokens", "total_tokens")
+
+
+class FleetDispatcher:
+    """
+    Pool individual chat completions into OpenAI Batch API jobs.
+
+    Requests passed to ``submit`` are queued. A background flusher sends them
+    as a single JSONL batch job once ``batch_min_size`` requests are waiting
+    or ``batch_window_ms`` has elapsed since the first one, polls the job and
+    resolves each caller with its own response.
+
+    Use as an async context manager so pending requests are flushed on exit.
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        model: str,
+        temperature: float = 0.2,
+        max_tokens: int = 4000,
+        batch_window_ms: int = 200,
+        batch_min_size: int = 50,
+        poll_interval_s: float = 15.0,
+        completion_window: str = "24h",
+        client: Any = None,
+    ):
+        """
+        Initialize the dispatcher.
+
+        Args:
+            api_key: OpenAI API key
+            model: Model name used for every request
+            temperature: Sampling temperature
+            max_tokens: Maximum tokens to generate per request
+            batch_window_ms: How long to wait for more requests before flushing
+            batch_min_size: Flush immediately once this many requests are queued
+            poll_interval_s: Seconds between batch job status checks
+            completion_window: Batch API completion window
+            client: Optional preconfigured openai.AsyncOpenAI client
+        """
+        self.api_key = api_key
+        self.model = model
+        self.temperature = temperature
+        self.max_tokens = max_tokens
+        self.batch_window_ms = batch_window_ms
+        self.batch_min_size = batch_min_size
+        self.poll_interval_s = poll_interval_s
+        self.completion_window = completion_window
+        self._client = client
+        self._queue: Optional[asyncio.Queue] = None
+        self._flusher: Optional[asyncio.Task] = None
+        self._jobs: Set[asyncio.Task] = set()
+
+    async def __aenter__(self) -> "FleetDispatcher":
+        self.start()
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
+
+    def start(self) -> None:
+        """Start the background flusher on the running event loop."""
+        if self._flusher is not None:
+            return
+        if self._client is None:
+            from openai import AsyncOpenAI
+
+            self._client = AsyncOpenAI(api_key=self.api_key)
+        self._queue = asyncio.Queue()
+        self._flusher = asyncio.create_task(self._flush_loop())
+
+    async def submit(self, spec: PromptSpec) -> LLMResponse:
+        """
+        Queue a request and wait for its response.
+
+        Args:
+            spec: Prompt, optional system message and optional JSON schema
+
+        Returns:
+            LLMResponse for this request
+
+        Raises:
+            LLMError: If the request or its batch job fails
+        """
+        self.start()
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((spec, future))
+        return await future
+
+    async def close(self) -> None:
+        """Flush queued requests and wait for in-flight batch jobs."""
+        if self._flusher is None:
+            return
+        await self._queue.put(None)
+        await self._flusher
+        if self._jobs:
+            await asyncio.gather(*self._jobs, return_exceptions=True)
+        self._flusher = None
+        self._queue = None
+
+    async def _flush_loop(self) -> None:
+        """Collect queued requests into batches and dispatch them."""
+        loop = asyncio.get_running_loop()
+        stopping = False
+        while not stopping:
+            item = await self._queue.get()
+            if item is None:
+                break
+
+            batch = [item]
+            deadline = loop.time() + self.batch_window_ms / 1000
+            while len(batch) < self.batch_min_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(self._queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+                if item is None:
+                    stopping = True
+                    break
+                batch.append(item)
+
+            job = asyncio.create_task(self._run_job(batch))
+            self._jobs.add(job)
+            job.add_done_callback(self._jobs.discard)
+
+    async def _run_job(self, batch: List[Tuple[PromptSpec, asyncio.Future]]) -> None:
+        """Run one batch job and resolve the futures of its requests."""
+        try:
+            results = await self._execute_batch([spec for spec, _ in batch])
+        except Exception as e:
+            logger.error("Batch job failed: %s", e)
+            error = e if isinstance(e, LLMError) else LLMError(f"Batch job failed: {e}")
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(error)
+            return
+
+        for (_, future), result in zip(batch, results):
+            if future.done():
+                continue
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+    async def _execute_batch(self, specs: List[PromptSpec]) -> List[Union[LLMResponse, LLMError]]:
+        """Upload a JSONL batch, wait for it to finish and parse its results."""
+        lines = "\n".join(
+            json.dumps({
+                "custom_id": str(index),
+                "method": "POST",
+                "url": _ENDPOINT,
+                "body": self._request_body(spec),
+            })
+            for index, spec in enumerate(specs)
+        )
+        input_file = await self._client.files.create(
+            file=("batch.jsonl", lines.encode("utf-8")),
+            purpose="batch",
+        )
+        job = await self._client.batches.create(
+            input_file_id=input_file.id,
+            endpoint=_ENDPOINT,
+            completion_window=self.completion_window,
+        )
+        logger.info("Submitted batch job %s with %s requests", job.id, len(specs))
+
+        while job.status not in _TERMINAL_STATUSES:
+            await asyncio.sleep(self.poll_interval_s)
+            job = await self._client.batches.retrieve(job.id)
+
+        if job.status != "completed":
+            raise LLMError(f"Batch job {job.id} ended with status {job.status}")
+        logger.info("Batch job %s completed", job.id)
+
+        results: List[Union[LLMResponse, LLMError]] = [
+            LLMError(f"No result for request {index} in batch job {job.id}")
+            for index in range(len(specs))
+        ]
+        for file_id in (job.output_file_id, job.error_file_id):
+            if not file_id:
+                continue
+            content = await self._client.files.content(file_id)
+            for line in content.text.splitlines():
+                if not line:
+                    continue
+                record = json.loads(line)
+                index = int(record["custom_id"])
+                results[index] = self._parse_result(record, specs[index], job.id)
+        return results
+
+    def _request_body(self, spec: PromptSpec) -> Dict[str, Any]:
+        """Build the chat completion request body for a prompt."""
+        messages = []
+        if spec.system_message:
+            messages.append({"role": "system", "content": spec.system_message})
+        messages.append({"role": "user", "content": spec.prompt})
+
+        body: Dict[str, Any] = {
+            "model": self.model,
+            "messages": messages,
+            "temperature": self.temperature,
+            "max_tokens": self.max_tokens,
+        }
+        if spec.schema is not None:
+            body["tools"] = [{
+                "type": "function",
+                "function": {
+                    "name": "generate_output",
+                    "description": "Generate structured output",
+                    "parameters": spec.schema,
+                },
+            }]
+            body["tool_choice"] = {"type": "function", "function": {"name": "generate_output"}}
+        return body
+
+    def _parse_result(
+        self,
+        record: Dict[str, Any],
+        spec: PromptSpec,
+        batch_id: str
+    ) -> Union[LLMResponse, LLMError]:
+        """Convert one line of batch output into an LLMResponse."""
+        response = record.get("response") or {}
+        if record.get("error") or response.get("status_code") != 200:
+            return LLMError(f"Batch request failed: {record.get('error') or response.get('body')}")
+
+        body = response["body"]
+        message = body["choices"][0]["message"]
+        if spec.schema is not None:
+            content = message["tool_calls"][0]["function"]["arguments"]
+        else:
+            content = message.get("content") or ""
+
+        usage = body.get("usage") or {}
+        return LLMResponse(
+            content=content,
+            model=body.get("model", self.model),
+            usage={key: usage[key] for key in _USAGE_KEYS if key in usage},
+            metadata={"batch_id": batch_id, "request_id": response.get("request_id")},
+        )
@@ -0,0 +1,138 @@
+"""On-disk cache for LLM provider responses."""
+import asyncio
+import contextlib
+import functools
+import hashlib
+import json
+import os
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Any, Callable, Iterator, Optional
+
+from .base import LLMResponse
+from ..utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+_DEFAULT_CACHE_DIR = Path.home() / ".cache" / "pragents" / "llm"
+
+# Set by bypass_cache(); context-local so it follows tasks and to_thread calls
+_bypass: ContextVar[bool] = ContextVar("llm_cache_bypass", default=False)
+
+
+@contextlib.contextmanager
+def bypass_cache() -> Iterator[None]:
+    """Skip the response cache for provider calls made within the block."""
+    token = _bypass.set(True)
+    try:
+        yield
+    finally:
+        _bypass.reset(token)
+
+
+def _enabled(provider: Any) -> bool:
+    """Whether a provider call should go through the cache."""
+    return bool(provider.config.get("cache_enabled")) and not _bypass.get()
+
+
+def _cache_path(provider: Any, kind: str, args: tuple, kwargs: dict) -> Path:
+    """Content-addressed cache file for a provider call."""
+    payload = json.dumps(
+        [
+            kind,
+            provider.config.get("model"),
+            provider.config.get("temperature"),
+            args,
+            kwargs,
+        ],
+        sort_keys=True,
+        default=str,
+    )
+    key = hashlib.blake2b(payload.encode("utf-8"), digest_size=20).hexdigest()
+    cache_dir = Path(provider.config.get("cache_dir") or _DEFAULT_CACHE_DIR).expanduser()
+    return cache_dir / key[:2] / f"{key}.json"
+
+
+def _load(path: Path) -> Optional[Any]:
+    """Read a cached result, or None on a miss."""
+    try:
+        data = json.loads(path.read_bytes())
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        logger.debug("Ignoring unreadable LLM cache entry %s: %s", path, e)
+        return None
+
+    if data.get("response"):
+        return LLMResponse.model_validate(data["value"])
+    return data["value"]
+
+
+def _store(path: Path, result: Any) -> None:
+    """Write a result atomically; failures only cost a future cache miss."""
+    if isinstance(result, LLMResponse):
+        data = {"response": True, "value": result.model_dump(mode="json")}
+    else:
+        data = {"response": False, "value": result}
+
+    tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path.write_text(json.dumps(data), encoding="utf-8")
+        os.replace(tmp_path, path)
+    except (OSError, TypeError, ValueError) as e:
+        logger.debug("Failed to write LLM cache entry %s: %s", path, e)
+        tmp_path.unlink(missing_ok=True)
+
+
+def cached_response(kind: str) -> Callable:
+    """
+    Cache a provider method's results on disk.
+
+    The key covers the model, temperature and all call arguments (prompt,
+    system message, schema, overrides). Caching is active when the provider
+    config has ``cache_enabled`` set, outside any ``bypass_cache()`` block. Works for sync and async methods.
+
+    Args:
+        kind: Cache namespace; sync and async variants of a call share one
+
+    Returns:
+        Decorator for provider methods
+    """
+    def decorator(method: Callable) -> Callable:
+        if asyncio.iscoroutinefunction(method):
+            @functools.wraps(method)
+            async def async_wrapper(self, *args: Any, **kwargs: Any) -> Any:
+                if not _enabled(self):
+                    return await method(self, *args, **kwargs)
+
+                path = _cache_path(self, kind, args, kwargs)
+                cached = await asyncio.to_thread(_load, path)
+                if cached is not None:
+                    logger.debug("LLM cache hit: %s", path.name)
+                    return cached
+
+                result = await method(self, *args, **kwargs)
+                await asyncio.to_thread(_store, path, result)
+                return result
+
+            return async_wrapper
+
+        @functools.wraps(method)
+        def wrapper(self, *args: Any, **kwargs: Any) -> Any:
+            if not _enabled(self):
+                return method(self, *args, **kwargs)
+
+            path = _cache_path(self, kind, args, kwargs)
+            cached = _load(path)
+            if cached is not None:
+                logger.debug("LLM cache hit: %s", path.name)
+                return cached
+
+            result = method(self, *args, **kwargs)
+            _store(path, result)
+            return result
+
+        return wrapper
+
+    return decorator
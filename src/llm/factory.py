@@ -1,35 +1,50 @@
 """LLM provider factory."""
-from typing import Any, Dict, Type
+import hashlib
+import importlib
+import threading
+from typing import Any, Dict, Tuple, Type, Union
 
 from .base import BaseLLMProvider, LLMError
-from .providers.openai import OpenAIProvider
 from ..utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Maximum number of providers kept by create_from_config
+_MAX_CACHED_PROVIDERS = 8
+
 
 class LLMFactory:
     """Factory for creating LLM providers."""
 
-    _providers: Dict[str, Type[BaseLLMProvider]] = {
-        "openai": OpenAIProvider,
+    # Providers are "module:Class" paths until first use so unused SDKs are never imported
+    _providers: Dict[str, Union[str, Type[BaseLLMProvider]]] = {
+        "openai": f"{__package__}.providers.openai:OpenAIProvider",
         # Add more providers as they are implemented
         # "anthropic": AnthropicProvider,
         # "azure_openai": AzureOpenAIProvider,
         # "google": GoogleProvider,
     }
 
+    # Providers built by create_from_config, least recently used first
+    _instances: Dict[Tuple[Any, ...], BaseLLMProvider] = {}
+    _instances_lock = threading.Lock()
+
     @classmethod
-    def register_provider(cls, name: str, provider_class: Type[BaseLLMProvider]) -> None:
+    def register_provider(
+        cls,
+        name: str,
+        provider_class: Union[str, Type[BaseLLMProvider]]
+    ) -> None:
         """
         Register a new LLM provider.
 
         Args:
             name: Provider name (e.g., 'openai', 'anthropic')
-            provider_class: Provider class that implements BaseLLMProvider
+            provider_class: Provider class that implements BaseLLMProvider, or
+                a "module:Class" path imported on first use
         """
         cls._providers[name] = provider_class
-        logger.info(f"Registered LLM provider: {name}")
+        logger.info("Registered LLM provider: %s", name)
 
     @classmethod
     def create(cls, provider_name: str, **kwargs: Any) -> BaseLLMProvider:
@@ -52,19 +67,32 @@ class LLMFactory:
                 f"Unknown LLM provider '{provider_name}'. Available providers: {available}"
             )
 
-        provider_class = cls._providers[provider_name]
         try:
-            logger.info(f"Creating LLM provider: {provider_name}")
+            provider_class = cls._resolve_provider(provider_name)
+            logger.info("Creating LLM provider: %s", provider_name)
             return provider_class(**kwargs)
         except Exception as e:
-            logger.error(f"Failed to create LLM provider '{provider_name}': {e}")
+            logger.error("Failed to create LLM provider '%s': %s", provider_name, e)
             raise LLMError(f"Failed to create provider '{provider_name}': {e}")
 
+    @classmethod
+    def _resolve_provider(cls, provider_name: str) -> Type[BaseLLMProvider]:
+        """Import a lazily registered provider class on first use."""
+        provider_class = cls._providers[provider_name]
+        if isinstance(provider_class, str):
+            module_name, _, class_name = provider_class.partition(":")
+            provider_class = getattr(importlib.import_module(module_name), class_name)
+            cls._providers[provider_name] = provider_class
+        return provider_class
+
     @classmethod
     def create_from_config(cls, config: Any) -> BaseLLMProvider:
         """
         Create an LLM provider from configuration object.
 
+        Providers are memoized per configuration, so repeated workflow runs
+        reuse the same instance and its client.
+
         Args:
             config: LLMConfig object with provider settings
 
@@ -76,6 +104,11 @@ class LLMFactory:
             "model": config.model,
             "temperature": config.temperature,
             "max_tokens": config.max_tokens,
+            "latency_budget_ms": config.latency_budget_ms,
+            "batch_sync_threshold_ms": config.batch_sync_threshold_ms,
+            "cache_enabled": config.cache_enabled,
+            "rate_limit_rpm": config.rate_limit_rpm,
+            "rate_limit_tpm": config.rate_limit_tpm,
         }
 
         # Add provider-specific configs
@@ -86,7 +119,22 @@ class LLMFactory:
                 "api_version": config.azure_openai.api_version,
             })
 
-        return cls.create(config.provider, **provider_kwargs)
+        key = cls._config_key(config.provider, provider_kwargs)
+        with cls._instances_lock:
+            provider = cls._instances.pop(key, None)
+            if provider is None:
+                provider = cls.create(config.provider, **provider_kwargs)
+                if len(cls._instances) >= _MAX_CACHED_PROVIDERS:
+                    cls._instances.pop(next(iter(cls._instances)))
+            cls._instances[key] = provider
+            return provider
+
+    @staticmethod
+    def _config_key(provider_name: str, provider_kwargs: Dict[str, Any]) -> Tuple[Any, ...]:
+        """Hashable cache key for provider settings; the API key is stored hashed."""
+        items = dict(provider_kwargs)
+        items["api_key"] = hashlib.blake2b(str(items["api_key"]).encode(), digest_size=16).hexdigest()
+        return (provider_name,) + tuple(sorted(items.items()))
 
     @classmethod
     def list_providers(cls) -> list[str]:
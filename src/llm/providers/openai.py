@@ -1,19 +1,45 @@
 """OpenAI LLM provider implementation."""
-import json
-from typing import Any, Dict, Optional
+import asyncio
+import functools
+import threading
+from typing import Any, ClassVar, Dict, Iterator, List, Optional, Tuple, Union
 
-from langchain_core.messages import SystemMessage, HumanMessage
-from langchain_openai import ChatOpenAI
+import orjson
+from langchain_core.messages import BaseMessage, SystemMessage, HumanMessage
 
-from ..base import BaseLLMProvider, LLMResponse, LLMError, LLMAuthenticationError
+from ..base import BaseLLMProvider, LLMResponse, LLMError, LLMAuthenticationError, PromptSpec
+from ..cache import cached_response
+from ..rate_limiter import TokenBucket, estimate_tokens
+from ...utils.helpers import register_loop_cleanup, run_async
 from ...utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+_FUNCTION_CALL = {"name": "generate_output"}
+
+
+@functools.lru_cache(maxsize=64)
+def _function_spec(schema_json: bytes) -> Dict[str, Any]:
+    """Function-calling spec for a schema, shared by every call using it."""
+    return {
+        "name": "generate_output",
+        "description": "Generate structured output",
+        "parameters": orjson.loads(schema_json),
+    }
+
 
 class OpenAIProvider(BaseLLMProvider):
     """OpenAI GPT provider."""
 
+    supports_streaming = True
+
+    # Connection pool shared by every provider instance for synchronous calls.
+    # Async calls get a client per event loop (see _async_client): an
+    # AsyncClient's connections are tied to one loop, and workflow nodes each
+    # run their own.
+    _http_client: ClassVar[Optional[Any]] = None
+    _http_client_lock: ClassVar[threading.Lock] = threading.Lock()
+
     def __init__(self, **kwargs: Any):
         """
         Initialize OpenAI provider.
@@ -23,22 +49,171 @@ class OpenAIProvider(BaseLLMProvider):
             model: Model name (e.g., 'gpt-4', 'gpt-3.5-turbo')
             temperature: Temperature for generation (default: 0.2)
             max_tokens: Maximum tokens to generate (default: 4000)
+            http_async_client: Shared httpx.AsyncClient for async calls (optional;
+                by default each event loop gets its own client)
+            latency_budget_ms: Acceptable latency for batched generation (default: 0)
+            batch_sync_threshold_ms: Budget above which batches go through the
+                OpenAI Batch API instead of concurrent requests (default: 300000)
+            cache_enabled: Cache responses on disk (default: False)
+            cache_dir: Response cache directory (default: ~/.cache/pragents/llm)
+            rate_limit_rpm: Requests per minute to pace calls to (default: 0, unlimited)
+            rate_limit_tpm: Prompt tokens per minute to pace calls to (default: 0, unlimited)
         """
         super().__init__(**kwargs)
         self._validate_config(["api_key", "model"])
+        # Client bound to each schema's function spec, keyed by serialized schema
+        self._bound_models: Dict[bytes, Any] = {}
+        # (ChatOpenAI, httpx.AsyncClient) for async calls, keyed by the event
+        # loop they were built on
+        self._async_clients: Dict[asyncio.AbstractEventLoop, Tuple[Any, Any]] = {}
+        self._async_clients_lock = threading.Lock()
+        # Proactive pacing so concurrent generation stays under the account's limits
+        rpm = self.config.get("rate_limit_rpm") or 0
+        tpm = self.config.get("rate_limit_tpm") or 0
+        self._rpm_bucket = TokenBucket.per_minute(rpm) if rpm else None
+        self._tpm_bucket = TokenBucket.per_minute(tpm) if tpm else None
+        logger.info("Initialized OpenAI provider with model: %s", self.config['model'])
+
+    @functools.cached_property
+    def client(self) -> Any:
+        """ChatOpenAI client for sync calls, built on first use to keep provider creation cheap."""
+        return self._build_client(self.config.get("http_async_client"))
+
+    def _async_client(self) -> Any:
+        """
+        ChatOpenAI client for async calls on the running event loop.
+
+        Providers are memoized across workflow runs, and each run_async call
+        starts a new loop. LangChain's default AsyncClient is process-wide, so
+        its pooled connections would outlive the loop that opened them; each
+        live loop instead gets a client with its own AsyncClient, closed when
+        a run_async loop shuts down. Entries for other loops that have since
+        closed are dropped. A configured http_async_client is owned by the
+        caller and used as-is.
+
+        Returns:
+            ChatOpenAI client whose async connections belong to the running loop
+        """
+        if self.config.get("http_async_client") is not None:
+            return self.client
+
+        loop = asyncio.get_running_loop()
+        with self._async_clients_lock:
+            entry = self._async_clients.get(loop)
+            if entry is None:
+                for stale in [key for key in self._async_clients if key.is_closed()]:
+                    logger.debug("Dropping async client of a closed event loop")
+                    del self._async_clients[stale]
+                http_async_client = self._new_http_async_client()
+                entry = (self._build_client(http_async_client), http_async_client)
+                self._async_clients[loop] = entry
+                register_loop_cleanup(functools.partial(self._close_async_client, loop))
+            return entry[0]
 
+    async def _close_async_client(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Close the async client built for a loop that is shutting down."""
+        with self._async_clients_lock:
+            entry = self._async_clients.pop(loop, None)
+        if entry is not None:
+            await entry[1].aclose()
+
+    @staticmethod
+    def _new_http_async_client() -> Any:
+        """Create an httpx.AsyncClient pooled like the shared sync client."""
+        import httpx
+
+        return httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+            timeout=httpx.Timeout(60, connect=5),
+        )
+
+    def _build_client(self, http_async_client: Any = None) -> Any:
+        """Create a ChatOpenAI client using the shared sync connection pool."""
         try:
-            self.client = ChatOpenAI(
+            from langchain_openai import ChatOpenAI
+
+            return ChatOpenAI(
                 api_key=self.config["api_key"],
                 model=self.config["model"],
                 temperature=self.config.get("temperature", 0.2),
                 max_tokens=self.config.get("max_tokens", 4000),
+                http_client=self._shared_http_client(),
+                http_async_client=http_async_client,
             )
-            logger.info(f"Initialized OpenAI provider with model: {self.config['model']}")
         except Exception as e:
-            logger.error(f"Failed to initialize OpenAI provider: {e}")
+            logger.error("Failed to initialize OpenAI provider: %s", e)
             raise LLMAuthenticationError(f"OpenAI initialization failed: {e}")
 
+    @classmethod
+    def _shared_http_client(cls) -> Any:
+        """Return the class-wide pooled httpx.Client, creating it on first use."""
+        with cls._http_client_lock:
+            if cls._http_client is None:
+                import httpx
+
+                cls._http_client = httpx.Client(
+                    http2=True,
+                    limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+                    timeout=httpx.Timeout(60, connect=5),
+                )
+            return cls._http_client
+
+    @staticmethod
+    def _build_messages(prompt: str, system_message: Optional[str]) -> List[BaseMessage]:
+        """Build the chat message list for a prompt."""
+        messages: List[BaseMessage] = []
+        if system_message:
+            messages.append(SystemMessage(content=system_message))
+        messages.append(HumanMessage(content=prompt))
+        return messages
+
+    @property
+    def _rate_limited(self) -> bool:
+        """Whether requests are paced by a token bucket."""
+        return self._rpm_bucket is not None or self._tpm_bucket is not None
+
+    async def _throttle(self, prompt: str, system_message: Optional[str]) -> None:
+        """Wait for rate limit capacity for one request."""
+        if self._rpm_bucket is not None:
+            await self._rpm_bucket.acquire(1)
+        if self._tpm_bucket is not None:
+            await self._tpm_bucket.acquire(estimate_tokens(self.config["model"], prompt, system_message))
+
+    def _throttle_sync(self, prompt: str, system_message: Optional[str]) -> None:
+        """Blocking variant of ``_throttle``."""
+        if self._rpm_bucket is not None:
+            self._rpm_bucket.acquire_sync(1)
+        if self._tpm_bucket is not None:
+            self._tpm_bucket.acquire_sync(estimate_tokens(self.config["model"], prompt, system_message))
+
+    def _bind_schema(self, schema: Dict[str, Any]) -> Any:
+        """Return the client bound to a schema's function, binding it once per schema."""
+        schema_json = orjson.dumps(schema, option=orjson.OPT_SORT_KEYS)
+        model = self._bound_models.get(schema_json)
+        if model is None:
+            model = self.client.bind(
+                functions=[_function_spec(schema_json)],
+                function_call=_FUNCTION_CALL,
+            )
+            self._bound_models[schema_json] = model
+        return model
+
+    def _to_response(self, response: Any) -> LLMResponse:
+        """Convert a LangChain chat message into an LLMResponse."""
+        token_usage = response.response_metadata.get("token_usage") or {}
+        return LLMResponse(
+            content=response.content,
+            model=self.config["model"],
+            usage={
+                "prompt_tokens": token_usage.get("prompt_tokens"),
+                "completion_tokens": token_usage.get("completion_tokens"),
+                "total_tokens": token_usage.get("total_tokens"),
+            },
+            metadata=response.response_metadata,
+        )
+
+    @cached_response("generate")
     def generate(
         self,
         prompt: str,
@@ -57,28 +232,171 @@ class OpenAIProvider(BaseLLMProvider):
             LLMResponse with generated content
         """
         try:
-            messages = []
-            if system_message:
-                messages.append(SystemMessage(content=system_message))
-            messages.append(HumanMessage(content=prompt))
+            messages = self._build_messages(prompt, system_message)
 
-            logger.debug(f"Generating with OpenAI, prompt length: {len(prompt)}")
+            logger.debug("Generating with OpenAI, prompt length: %s", len(prompt))
+            self._throttle_sync(prompt, system_message)
             response = self.client.invoke(messages, **kwargs)
 
-            return LLMResponse(
-                content=response.content,
-                model=self.config["model"],
-                usage={
-                    "prompt_tokens": response.response_metadata.get("token_usage", {}).get("prompt_tokens"),
-                    "completion_tokens": response.response_metadata.get("token_usage", {}).get("completion_tokens"),
-                    "total_tokens": response.response_metadata.get("token_usage", {}).get("total_tokens"),
-                },
-                metadata=response.response_metadata,
-            )
+            return self._to_response(response)
+        except Exception as e:
+            logger.error("OpenAI generation failed: %s", e)
+            raise LLMError(f"Generation failed: {e}")
+
+    @cached_response("generate")
+    async def agenerate(
+        self,
+        prompt: str,
+        system_message: Optional[str] = None,
+        **kwargs: Any
+    ) -> LLMResponse:
+        """
+        Generate text using OpenAI's async client.
+
+        Args:
+            prompt: The input prompt
+            system_message: Optional system message
+            **kwargs: Additional parameters (temperature, max_tokens, etc.)
+
+        Returns:
+            LLMResponse with generated content
+        """
+        try:
+            messages = self._build_messages(prompt, system_message)
+
+            logger.debug("Generating async with OpenAI, prompt length: %s", len(prompt))
+            await self._throttle(prompt, system_message)
+            response = await self._async_client().ainvoke(messages, **kwargs)
+
+            return self._to_response(response)
         except Exception as e:
-            logger.error(f"OpenAI generation failed: {e}")
+            logger.error("OpenAI generation failed: %s", e)
             raise LLMError(f"Generation failed: {e}")
 
+    def generate_batch(
+        self,
+        specs: List[PromptSpec],
+        max_concurrency: int = 5,
+        return_exceptions: bool = False
+    ) -> List[Union[LLMResponse, Exception]]:
+        """
+        Generate responses for a batch of prompt specs.
+
+        When the configured latency budget exceeds the sync threshold the specs
+        are pooled into an OpenAI Batch API job (half the token cost, minutes to
+        hours of latency). Otherwise plain prompts go through the client's batch
+        interface, while specs with a schema, or any specs when requests are
+        rate limited, are sent as individually generated concurrent requests.
+
+        Args:
+            specs: Requests to generate
+            max_concurrency: Maximum number of concurrent requests
+            return_exceptions: Return per-spec exceptions instead of raising
+
+        Returns:
+            LLMResponse (or exception, if return_exceptions) per spec, in order
+        """
+        if specs and self._use_batch_api():
+            return run_async(self._dispatch_batch(specs, return_exceptions))
+
+        # The client's batch call can't bind schemas or pace each request
+        if self._rate_limited or any(spec.schema is not None for spec in specs):
+            return super().generate_batch(specs, max_concurrency, return_exceptions)
+
+        try:
+            batch = [self._build_messages(spec.prompt, spec.system_message) for spec in specs]
+
+            logger.debug("Batch generating with OpenAI, prompts: %s", len(batch))
+            responses = self.client.batch(
+                batch,
+                config={"max_concurrency": max_concurrency},
+                return_exceptions=return_exceptions,
+            )
+        except Exception as e:
+            logger.error("OpenAI batch generation failed: %s", e)
+            raise LLMError(f"Batch generation failed: {e}")
+
+        return [
+            LLMError(f"Generation failed: {response}") if isinstance(response, Exception)
+            else self._to_response(response)
+            for response in responses
+        ]
+
+    async def agenerate_batch(
+        self,
+        specs: List[PromptSpec],
+        max_concurrency: int = 5,
+        return_exceptions: bool = False
+    ) -> List[Union[LLMResponse, Exception]]:
+        """
+        Async variant of ``generate_batch``.
+
+        Args:
+            specs: Requests to generate
+            max_concurrency: Maximum number of concurrent requests
+            return_exceptions: Return per-spec exceptions instead of raising
+
+        Returns:
+            LLMResponse (or exception, if return_exceptions) per spec, in order
+        """
+        if specs and self._use_batch_api():
+            return await self._dispatch_batch(specs, return_exceptions)
+        return await super().agenerate_batch(specs, max_concurrency, return_exceptions)
+
+    def _use_batch_api(self) -> bool:
+        """Whether the latency budget allows routing batches via the Batch API."""
+        return self.config.get("latency_budget_ms", 0) > self.config.get("batch_sync_threshold_ms", 300000)
+
+    async def _dispatch_batch(
+        self,
+        specs: List[PromptSpec],
+        return_exceptions: bool
+    ) -> List[Union[LLMResponse, Exception]]:
+        """Submit specs through a FleetDispatcher and gather the responses."""
+        from ..batch_dispatcher import FleetDispatcher
+
+        async with FleetDispatcher(
+            api_key=self.config["api_key"],
+            model=self.config["model"],
+            temperature=self.config.get("temperature", 0.2),
+            max_tokens=self.config.get("max_tokens", 4000),
+            batch_min_size=len(specs),
+        ) as dispatcher:
+            return await asyncio.gather(
+                *(dispatcher.submit(spec) for spec in specs),
+                return_exceptions=return_exceptions,
+            )
+
+    def generate_stream(
+        self,
+        prompt: str,
+        system_message: Optional[str] = None,
+        **kwargs: Any
+    ) -> Iterator[str]:
+        """
+        Stream generated text from OpenAI.
+
+        Args:
+            prompt: The input prompt
+            system_message: Optional system message
+            **kwargs: Additional parameters (temperature, max_tokens, etc.)
+
+        Yields:
+            Chunks of generated text
+        """
+        try:
+            messages = self._build_messages(prompt, system_message)
+
+            logger.debug("Streaming with OpenAI, prompt length: %s", len(prompt))
+            self._throttle_sync(prompt, system_message)
+            for chunk in self.client.stream(messages, **kwargs):
+                if chunk.content:
+                    yield chunk.content
+        except Exception as e:
+            logger.error("OpenAI streaming failed: %s", e)
+            raise LLMError(f"Streaming generation failed: {e}")
+
+    @cached_response("generate_with_schema")
     def generate_with_schema(
         self,
         prompt: str,
@@ -99,40 +417,28 @@ class OpenAIProvider(BaseLLMProvider):
             Dictionary matching the schema
         """
         try:
-            # Use function calling for structured output
-            function_spec = {
-                "name": "generate_output",
-                "description": "Generate structured output",
-                "parameters": schema
-            }
-
-            messages = []
-            if system_message:
-                messages.append(SystemMessage(content=system_message))
-            messages.append(HumanMessage(content=prompt))
-
-            logger.debug(f"Generating structured output with schema: {schema.get('title', 'unnamed')}")
+            messages = self._build_messages(prompt, system_message)
+
+            logger.debug("Generating structured output with schema: %s", schema.get("title", "unnamed"))
             
-            # Bind the function to the model
-            model_with_function = self.client.bind(
-                functions=[function_spec],
-                function_call={"name": "generate_output"}
-            )
+            # Use function calling for structured output
+            model_with_function = self._bind_schema(schema)
+            self._throttle_sync(prompt, system_message)
             
             response = model_with_function.invoke(messages, **kwargs)
             
             # Extract function call arguments
             if hasattr(response, "additional_kwargs") and "function_call" in response.additional_kwargs:
                 function_call = response.additional_kwargs["function_call"]
-                result = json.loads(function_call["arguments"])
+                result = orjson.loads(function_call["arguments"])
                 return result
             else:
                 # Fallback: try to parse JSON from content
                 try:
-                    return json.loads(response.content)
-                except json.JSONDecodeError:
+                    return orjson.loads(response.content)
+                except orjson.JSONDecodeError:
                     raise LLMError("Failed to extract structured output from response")
 
         except Exception as e:
-            logger.error(f"Structured generation failed: {e}")
+            logger.error("Structured generation failed: %s", e)
             raise LLMError(f"Structured generation failed: {e}")
@@ -0,0 +1,117 @@
+"""Client-side rate limiting for LLM providers."""
+import asyncio
+import functools
+import threading
+import time
+from typing import Any, Optional
+
+try:
+    import tiktoken
+except ImportError:
+    tiktoken = None
+
+from ..utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Rough characters-per-token ratio used when tiktoken is unavailable
+_CHARS_PER_TOKEN = 4
+
+
+class TokenBucket:
+    """
+    Token bucket pacing requests to a sustained rate with bounded bursts.
+
+    State is guarded by a thread lock rather than asyncio primitives, so one
+    bucket can be shared by a provider used from several event loops (each
+    workflow node runs its own) and from worker threads.
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        """
+        Initialize the bucket, starting full.
+
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum tokens held at once (default: one second's worth)
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(rate, 1.0)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def per_minute(cls, limit: int) -> "TokenBucket":
+        """Bucket allowing ``limit`` tokens per minute, all usable in one burst."""
+        return cls(rate=limit / 60.0, capacity=float(limit))
+
+    def _reserve(self, tokens: float) -> float:
+        """Take tokens if available; otherwise return seconds until they will be."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            if self._tokens >= tokens:
+                self._tokens -= tokens
+                return 0.0
+            return (tokens - self._tokens) / self.rate
+
+    async def acquire(self, tokens: float = 1.0) -> None:
+        """
+        Wait until ``tokens`` are available and take them.
+
+        Requests larger than the capacity are clamped to it so they can
+        still proceed once the bucket is full.
+
+        Args:
+            tokens: Number of tokens to take
+        """
+        tokens = min(tokens, self.capacity)
+        while (wait := self._reserve(tokens)) > 0:
+            await asyncio.sleep(wait)
+
+    def acquire_sync(self, tokens: float = 1.0) -> None:
+        """Blocking variant of ``acquire`` for synchronous callers."""
+        tokens = min(tokens, self.capacity)
+        while (wait := self._reserve(tokens)) > 0:
+            time.sleep(wait)
+
+
+@functools.lru_cache(maxsize=16)
+def _encoding(model: str) -> Any:
+    """tiktoken encoding for a model, or None if it can't be resolved."""
+    if tiktoken is None:
+        return None
+    try:
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        return tiktoken.get_encoding("cl100k_base")
+    except Exception as e:
+        logger.debug("No tiktoken encoding for %s: %s", model, e)
+        return None
+
+
+def estimate_tokens(model: str, *texts: Optional[str]) -> int:
+    """
+    Estimate the prompt tokens a request will consume.
+
+    Args:
+        model: Model name, used to pick the tokenizer
+        *texts: Prompt text fragments; None entries are skipped
+
+    Returns:
+        Token count, exact with tiktoken installed, approximate otherwise
+    """
+    encoding = _encoding(model)
+    total = 0
+    for text in texts:
+        if not text:
+            continue
+        if encoding is not None:
+            total += len(encoding.encode(text, disallowed_special=()))
+        else:
+            total += len(text) // _CHARS_PER_TOKEN + 1
+    return total
@@ -1,4 +1,5 @@
 """Streamlit UI application."""
+import json
 import sys
 from pathlib import Path
 
@@ -7,6 +8,8 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 import requests
 import streamlit as st
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from config.settings import get_settings
 
@@ -17,6 +20,59 @@ try:
 except:
     api_url = "http://localhost:8000/api"
 
+# (connect, read) timeout for API calls so the UI never hangs on a dead API
+REQUEST_TIMEOUT = (2, 30)
+
+
+@st.cache_resource
+def _api_session() -> requests.Session:
+    """Keep-alive HTTP session shared across Streamlit reruns."""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=16,
+        max_retries=Retry(total=2, backoff_factor=0.2),
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def _render_workflow_status(container, workflow: dict) -> None:
+    """Draw the current workflow's status into a placeholder container."""
+    with container:
+        col1, col2, col3 = st.columns(3)
+        
+        with col1:
+            status_color = {
+                "pending": "🟡",
+                "running": "🔵",
+                "success": "🟢",
+                "failed": "🔴"
+            }.get(workflow["status"], "⚪")
+            
+            st.metric("Status", f"{status_color} {workflow['status'].upper()}")
+        
+        with col2:
+            if workflow.get("coverage_before"):
+                st.metric("Coverage Before", f"{workflow['coverage_before']:.1f}%")
+        
+        with col3:
+            if workflow.get("current_step"):
+                st.metric("Current Step", workflow["current_step"].replace("_", " ").title())
+        
+        # Show PR link if available
+        if workflow.get("pr_url"):
+            st.success("✅ Pull Request Created!")
+            st.markdown(f"[View Pull Request →]({workflow['pr_url']})")
+        
+        # Show errors if any
+        if workflow.get("errors"):
+            st.error("Errors:")
+            for error in workflow["errors"]:
+                st.write(f"- {error}")
+
+
 st.set_page_config(
     page_title="Code Coverage Agent",
     page_icon="🤖",
@@ -53,6 +109,44 @@ with st.sidebar:
 # Main content
 tab1, tab2 = st.tabs(["Current Workflow", "Workflow History"])
 
+# History and footer render first: the live status stream below keeps
+# the script running until the current workflow finishes
+with tab2:
+    st.header("Workflow History")
+    
+    try:
+        response = _api_session().get(
+            f"{api_url}/workflow/",
+            params={"limit": 10, "order": "desc"},
+            timeout=REQUEST_TIMEOUT,
+        )
+        response.raise_for_status()
+        data = response.json()
+        
+        workflows = data.get("workflows", [])
+        
+        if workflows:
+            for wf in workflows:  # Newest 10, sorted by the API
+                with st.expander(f"Workflow {wf['workflow_id'][:8]}... - {wf.get('status', 'unknown')}"):
+                    st.write(f"**Created:** {wf.get('created_at', 'N/A')}")
+                    st.write(f"**Status:** {wf.get('status', 'N/A')}")
+                    
+                    if wf.get("request"):
+                        st.write("**Configuration:**")
+                        st.json(wf["request"])
+                   
+                    if wf.get("pr_url"):
+                        st.markdown(f"[View PR]({wf['pr_url']})")
+        else:
+            st.info("No workflows found")
+    
+    except Exception as e:
+        st.error(f"Failed to fetch workflow history: {e}")
+
+# Footer
+st.markdown("---")
+st.markdown("*Powered by LangGraph, FastAPI, and Streamlit*")
+
 with tab1:
     st.header("Current Workflow")
     
@@ -62,13 +156,14 @@ with tab1:
         else:
             with st.spinner("Starting workflow..."):
                 try:
-                    response = requests.post(
+                    response = _api_session().post(
                         f"{api_url}/workflow/start",
                         json={
                             "repo_url": repo_url,
                             "sonar_project_key": sonar_key,
                             "coverage_threshold": threshold
-                        }
+                        },
+                        timeout=REQUEST_TIMEOUT,
                     )
                     response.raise_for_status()
                     data = response.json()
@@ -78,81 +173,24 @@ with tab1:
                 except Exception as e:
                     st.error(f"Failed to start workflow: {e}")
     
-    # Display current workflow status
+    # Display current workflow status, updated live from the status stream
     if "workflow_id" in st.session_state:
         workflow_id = st.session_state.workflow_id
+        placeholder = st.empty()
         
         try:
-            response = requests.get(f"{api_url}/workflow/{workflow_id}")
-            response.raise_for_status()
-            workflow = response.json()
-            
-            col1, col2, col3 = st.columns(3)
-            
-            with col1:
-                status_color = {
-                    "pending": "🟡",
-                    "running": "🔵",
-                    "success": "🟢",
-                    "failed": "🔴"
-                }.get(workflow["status"], "⚪")
-                
-                st.metric("Status", f"{status_color} {workflow['status'].upper()}")
-            
-            with col2:
-                if workflow.get("coverage_before"):
-                    st.metric("Coverage Before", f"{workflow['coverage_before']:.1f}%")
-            
-            with col3:
-                if workflow.get("current_step"):
-                    st.metric("Current Step", workflow["current_step"].replace("_", " ").title())
-            
-            # Show PR link if available
-            if workflow.get("pr_url"):
-                st.success("✅ Pull Request Created!")
-                st.markdown(f"[View Pull Request →]({workflow['pr_url']})")
-            
-            # Show errors if any
-            if workflow.get("errors"):
-                st.error("Errors:")
-                for error in workflow["errors"]:
-                    st.write(f"- {error}")
-            
-            # Refresh button
-            if st.button("🔄 Refresh Status"):
-                st.rerun()
+            with _api_session().get(
+                f"{api_url}/workflow/{workflow_id}/stream",
+                stream=True,
+                timeout=REQUEST_TIMEOUT,
+            ) as response:
+                response.raise_for_status()
+                workflow = {}
+                for line in response.iter_lines(decode_unicode=True):
+                    if not line or not line.startswith("data:"):
+                        continue
+                    workflow.update(json.loads(line[len("data:"):]))
+                    _render_workflow_status(placeholder.container(), workflow)
         
         except Exception as e:
             st.error(f"Failed to fetch workflow status: {e}")
-
-with tab2:
-    st.header("Workflow History")
-    
-    try:
-        response = requests.get(f"{api_url}/workflow/")
-        response.raise_for_status()
-        data = response.json()
-        
-        workflows = data.get("workflows", [])
-        
-        if workflows:
-            for wf in reversed(workflows[-10:]):  # Show last 10
-                with st.expander(f"Workflow {wf['workflow_id'][:8]}... - {wf.get('status', 'unknown')}"):
-                    st.write(f"**Created:** {wf.get('created_at', 'N/A')}")
-                    st.write(f"**Status:** {wf.get('status', 'N/A')}")
-                    
-                    if wf.get("request"):
-                        st.write("**Configuration:**")
-                        st.json(wf["request"])
-                   
-                    if wf.get("pr_url"):
-                        st.markdown(f"[View PR]({wf['pr_url']})")
-        else:
-            st.info("No workflows found")
-    
-    except Exception as e:
-        st.error(f"Failed to fetch workflow history: {e}")
-
-# Footer
-st.markdown("---")
-st.markdown("*Powered by LangGraph, FastAPI, and Streamlit*")
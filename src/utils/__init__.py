@@ -1,12 +1,15 @@
 """Utilities package."""
 from .logger import setup_logger, get_logger
-from .helpers import ensure_directory, retry, sanitize_branch_name, truncate_string
+from .helpers import ensure_directory, retry, aretry, register_loop_cleanup, run_async, sanitize_branch_name, truncate_string
 
 __all__ = [
     "setup_logger",
     "get_logger",
     "ensure_directory",
     "retry",
+    "aretry",
+    "register_loop_cleanup",
+    "run_async",
     "sanitize_branch_name",
     "truncate_string",
 ]
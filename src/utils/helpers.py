@@ -1,14 +1,47 @@
 """Helper utilities and common functions."""
+import asyncio
 import functools
-import time
+import re
+import threading
 from pathlib import Path
-from typing import Any, Callable, TypeVar, Optional
+from typing import Any, Awaitable, Callable, Coroutine, Dict, List, TypeVar
 import logging
 
+import tenacity
+from tenacity import (
+    AsyncRetrying,
+    RetryCallState,
+    before_sleep_log,
+    retry_if_exception_type,
+    stop_after_attempt,
+    wait_fixed,
+    wait_random_exponential,
+)
+from tenacity.wait import wait_base
+
+try:
+    import uvloop
+except ImportError:  # uvloop is optional (and unavailable on Windows)
+    uvloop = None
+
 logger = logging.getLogger(__name__)
 
 T = TypeVar("T")
 
+# ASCII characters not allowed in branch names map to hyphens
+_BRANCH_TRANS = str.maketrans({
+    c: "-" for c in map(chr, range(128)) if not (c.isalnum() or c in "-_")
+})
+_BRANCH_INVALID_RE = re.compile(r"[^\w-]")
+_DASH_RE = re.compile(r"-+")
+
+# Cleanups awaited before each run_async loop shuts down, keyed by loop
+_loop_cleanups: Dict[asyncio.AbstractEventLoop, List[Callable[[], Awaitable[None]]]] = {}
+_loop_cleanups_lock = threading.Lock()
+
+# Upper bound in seconds for a single retry wait
+_MAX_RETRY_DELAY = 60.0
+
 
 def ensure_directory(path: Path) -> None:
     """
@@ -20,6 +53,44 @@ def ensure_directory(path: Path) -> None:
     path.mkdir(parents=True, exist_ok=True)
 
 
+class _wait_retry_after(wait_base):
+    """Honor a server's Retry-After header, falling back to another wait strategy."""
+
+    def __init__(self, fallback: wait_base):
+        self.fallback = fallback
+
+    def __call__(self, retry_state: RetryCallState) -> float:
+        exception = retry_state.outcome.exception() if retry_state.outcome else None
+        headers = getattr(getattr(exception, "response", None), "headers", None)
+        if headers is not None:
+            try:
+                return min(float(headers.get("retry-after")), _MAX_RETRY_DELAY)
+            except (TypeError, ValueError):
+                pass
+        return self.fallback(retry_state)
+
+
+def _retry_options(
+    max_attempts: int,
+    delay: float,
+    exponential_backoff: bool,
+    exceptions: tuple,
+) -> Dict[str, Any]:
+    """Tenacity arguments shared by retry and aretry."""
+    if exponential_backoff:
+        # Full jitter keeps concurrent callers from retrying in lockstep
+        fallback = wait_random_exponential(multiplier=delay, max=_MAX_RETRY_DELAY)
+    else:
+        fallback = wait_fixed(delay)
+    return {
+        "stop": stop_after_attempt(max_attempts),
+        "wait": _wait_retry_after(fallback),
+        "retry": retry_if_exception_type(exceptions),
+        "before_sleep": before_sleep_log(logger, logging.WARNING),
+        "reraise": True,
+    }
+
+
 def retry(
     max_attempts: int = 3,
     delay: float = 1.0,
@@ -29,50 +100,110 @@ def retry(
     """
     Retry decorator for functions that may fail transiently.
 
+    Waits use jittered exponential backoff, or a server's Retry-After header
+    when the exception carries a response.
+
     Args:
         max_attempts: Maximum number of retry attempts
         delay: Initial delay between retries in seconds
-        exponential_backoff: If True, double delay after each retry
+        exponential_backoff: If True, grow the delay exponentially after each retry
         exceptions: Tuple of exception types to catch and retry
 
     Returns:
         Decorated function with retry logic
     """
-    def decorator(func: Callable[..., T]) -> Callable[..., T]:
+    return tenacity.retry(**_retry_options(max_attempts, delay, exponential_backoff, exceptions))
+
+
+def aretry(
+    max_attempts: int = 3,
+    delay: float = 1.0,
+    exponential_backoff: bool = True,
+    exceptions: tuple = (Exception,),
+) -> Callable:
+    """
+    Retry decorator for coroutine functions; waits with asyncio.sleep.
+
+    Args:
+        max_attempts: Maximum number of retry attempts
+        delay: Initial delay between retries in seconds
+        exponential_backoff: If True, grow the delay exponentially after each retry
+        exceptions: Tuple of exception types to catch and retry
+
+    Returns:
+        Decorated coroutine function with retry logic
+    """
+    options = _retry_options(max_attempts, delay, exponential_backoff, exceptions)
+
+    def decorator(func: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
         @functools.wraps(func)
-        def wrapper(*args: Any, **kwargs: Any) -> T:
-            current_delay = delay
-            last_exception: Optional[Exception] = None
-
-            for attempt in range(1, max_attempts + 1):
-                try:
-                    return func(*args, **kwargs)
-                except exceptions as e:
-                    last_exception = e
-                    if attempt == max_attempts:
-                        logger.error(
-                            f"Function {func.__name__} failed after {max_attempts} attempts: {e}"
-                        )
-                        raise
-
-                    logger.warning(
-                        f"Attempt {attempt}/{max_attempts} failed for {func.__name__}: {e}. "
-                        f"Retrying in {current_delay}s..."
-                    )
-                    time.sleep(current_delay)
-
-                    if exponential_backoff:
-                        current_delay *= 2
-
-            # This should never be reached, but satisfies type checker
-            if last_exception:
-                raise last_exception
-            raise RuntimeError("Unexpected retry loop exit")
+        async def wrapper(*args: Any, **kwargs: Any) -> T:
+            async for attempt in AsyncRetrying(**options):
+                with attempt:
+                    return await func(*args, **kwargs)
 
         return wrapper
     return decorator
 
 
+def run_async(coro: Coroutine[Any, Any, T]) -> T:
+    """
+    Run a coroutine to completion on a new event loop, like ``asyncio.run``.
+
+    Uses uvloop when installed, which cuts per-request overhead when many
+    HTTP calls are in flight.
+
+    Args:
+        coro: Coroutine to run
+
+    Returns:
+        The coroutine's result
+    """
+    if uvloop is not None:
+        return uvloop.run(_run_with_cleanups(coro))
+    return asyncio.run(_run_with_cleanups(coro))
+
+
+async def _run_with_cleanups(coro: Coroutine[Any, Any, T]) -> T:
+    """Await coro, then the cleanups registered for this loop while it ran."""
+    loop = asyncio.get_running_loop()
+    with _loop_cleanups_lock:
+        _loop_cleanups[loop] = []
+    try:
+        return await coro
+    finally:
+        with _loop_cleanups_lock:
+            callbacks = _loop_cleanups.pop(loop)
+        for callback in callbacks:
+            try:
+                await callback()
+            except Exception as e:
+                logger.warning("Event loop cleanup failed: %s", e)
+
+
+def register_loop_cleanup(callback: Callable[[], Awaitable[None]]) -> bool:
+    """
+    Await a callback before the running ``run_async`` loop shuts down.
+
+    Lets resources bound to the loop, such as an ``httpx.AsyncClient``, be
+    closed on the loop that owns them.
+
+    Args:
+        callback: Coroutine function to await at shutdown
+
+    Returns:
+        True if registered; False if the running loop wasn't started by
+        ``run_async``, in which case the caller owns the cleanup
+    """
+    loop = asyncio.get_running_loop()
+    with _loop_cleanups_lock:
+        callbacks = _loop_cleanups.get(loop)
+        if callbacks is None:
+            return False
+        callbacks.append(callback)
+        return True
+
+
 def sanitize_branch_name(name: str) -> str:
     """
     Sanitize a string to be used as a git branch name.
@@ -84,14 +215,11 @@ def sanitize_branch_name(name: str) -> str:
         Sanitized branch name
     """
     # Replace spaces and special characters with hyphens
-    sanitized = name.lower().strip()
-    sanitized = "".join(c if c.isalnum() or c in "-_" else "-" for c in sanitized)
-    # Remove multiple consecutive hyphens
-    while "--" in sanitized:
-        sanitized = sanitized.replace("--", "-")
-    # Remove leading/trailing hyphens
-    sanitized = sanitized.strip("-")
-    return sanitized
+    sanitized = name.lower().strip().translate(_BRANCH_TRANS)
+    if not sanitized.isascii():
+        sanitized = _BRANCH_INVALID_RE.sub("-", sanitized)
+    # Collapse consecutive hyphens and remove leading/trailing ones
+    return _DASH_RE.sub("-", sanitized).strip("-")
 
 
 def truncate_string(s: str, max_length: int = 100, suffix: str = "...") -> str:
@@ -106,6 +234,4 @@ def truncate_string(s: str, max_length: int = 100, suffix: str = "...") -> str:
     Returns:
         Truncated string
     """
-    if len(s) <= max_length:
-        return s
-    return s[: max_length - len(suffix)] + suffix
+    return s if len(s) <= max_length else s[: max_length - len(suffix)] + suffix
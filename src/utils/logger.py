@@ -1,17 +1,72 @@
 """Logging configuration and utilities."""
+import functools
+import json
 import logging
+import logging.handlers
+import os
 import sys
+import threading
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional
 
 from .helpers import ensure_directory
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional here
+    orjson = None
+
+DEFAULT_LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
+# Shared by every logger using the default format
+_FORMATTER = logging.Formatter(DEFAULT_LOG_FORMAT)
+
+# Log files rotate at this size, keeping this many backups
+_LOG_FILE_MAX_BYTES = 10_000_000
+_LOG_FILE_BACKUP_COUNT = 5
+
+
+class JsonFormatter(logging.Formatter):
+    """Format records as one JSON object per line, using orjson when available."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload = {
+            "time": self.formatTime(record),
+            "name": record.name,
+            "level": record.levelname,
+            "message": record.getMessage(),
+        }
+        if record.exc_info:
+            payload["exc_info"] = self.formatException(record.exc_info)
+        if orjson is not None:
+            return orjson.dumps(payload, default=str).decode("utf-8")
+        return json.dumps(payload, default=str)
+
+
+_JSON_FORMATTER = JsonFormatter()
+
+# Name of the console handler setup_logger attaches, used to find it again
+# even after sys.stdout has been replaced
+_CONSOLE_HANDLER_NAME = "pragents.console"
+
+# Serializes handler changes between concurrent setup calls
+_SETUP_LOCK = threading.Lock()
+
+
+def _find_handler(
+    logger: logging.Logger,
+    predicate: Callable[[logging.Handler], bool],
+) -> Optional[logging.Handler]:
+    """Return the logger's first handler matching predicate, if any."""
+    return next((h for h in logger.handlers if predicate(h)), None)
+
 
 def setup_logger(
     name: str,
     level: str = "INFO",
     log_file: Optional[str] = None,
     log_format: Optional[str] = None,
+    json_format: bool = False,
 ) -> logging.Logger:
     """
     Set up a logger with console and optionally file handlers.
@@ -21,41 +76,60 @@ def setup_logger(
         level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
         log_file: Optional path to log file
         log_format: Optional custom log format
+        json_format: Emit one JSON object per record instead of plain text
 
     Returns:
         Configured logger instance
     """
-    logger = logging.getLogger(name)
-    logger.setLevel(getattr(logging, level.upper()))
+    log_level = getattr(logging, level.upper())
 
-    # Remove existing handlers to avoid duplicates
-    logger.handlers.clear()
+    if json_format:
+        formatter = _JSON_FORMATTER
+    elif log_format is None:
+        formatter = _FORMATTER
+    else:
+        formatter = logging.Formatter(log_format)
 
-    # Default format
-    if log_format is None:
-        log_format = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-
-    formatter = logging.Formatter(log_format)
+    logger = logging.getLogger(name)
+    # Repeated setup (module reloads, Streamlit reruns) reconfigures the
+    # existing handlers instead of stacking or reopening them
+    with _SETUP_LOCK:
+        logger.setLevel(log_level)
 
-    # Console handler
-    console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setLevel(getattr(logging, level.upper()))
-    console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
+        # Console handler
+        console_handler = _find_handler(
+            logger,
+            lambda h: h.get_name() == _CONSOLE_HANDLER_NAME,
+        )
+        if console_handler is None:
+            console_handler = logging.StreamHandler(sys.stdout)
+            console_handler.set_name(_CONSOLE_HANDLER_NAME)
+            logger.addHandler(console_handler)
+        console_handler.setLevel(log_level)
+        console_handler.setFormatter(formatter)
 
-    # File handler (optional)
-    if log_file:
-        log_path = Path(log_file)
-        ensure_directory(log_path.parent)
-        
-        file_handler = logging.FileHandler(log_file)
-        file_handler.setLevel(getattr(logging, level.upper()))
-        file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
+        # File handler (optional)
+        if log_file:
+            log_path = os.path.abspath(log_file)
+            file_handler = _find_handler(
+                logger,
+                lambda h: isinstance(h, logging.FileHandler) and h.baseFilename == log_path,
+            )
+            if file_handler is None:
+                ensure_directory(Path(log_path).parent)
+                file_handler = logging.handlers.RotatingFileHandler(
+                    log_path,
+                    maxBytes=_LOG_FILE_MAX_BYTES,
+                    backupCount=_LOG_FILE_BACKUP_COUNT,
+                )
+                logger.addHandler(file_handler)
+            file_handler.setLevel(log_level)
+            file_handler.setFormatter(formatter)
 
     return logger
 
 
+@functools.lru_cache(maxsize=None)
 def get_logger(name: str) -> logging.Logger:
     """
     Get an existing logger or create a new one with default settings.
@@ -67,6 +141,8 @@ def get_logger(name: str) -> logging.Logger:
         Logger instance
     """
     logger = logging.getLogger(name)
-    if not logger.handlers:
+    # hasHandlers also checks ancestors, so children of a configured logger
+    # reuse its handlers instead of getting their own
+    if not logger.hasHandlers():
         setup_logger(name)
     return logger
@@ -4,6 +4,7 @@ from .graph import compiled_workflow, create_workflow_graph
 from src.workflow.nodes import (
     clone_repository_node,
     check_coverage_node,
+    join_node,
     should_generate_tests,
     analyze_code_node,
     generate_tests_node,
@@ -16,6 +17,7 @@ __all__ = [
     "create_workflow_graph",
     "clone_repository_node",
     "check_coverage_node",
+    "join_node",
     "should_generate_tests",
     "analyze_code_node",
     "generate_tests_node",
@@ -1,22 +1,74 @@
 """Workflow node implementations."""
+import functools
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any
+from typing import TYPE_CHECKING, Dict, Any
 
 from .state import WorkflowState
-from ..agents import (
-    GitAgent,
-    SonarQubeAgent,
-    AnalyzerAgent,
-    TestGeneratorAgent,
-    PRAzureDevOpsAgent
-)
-from ..llm import LLMFactory
 from ..config import get_settings
+from ..utils.helpers import run_async
 from ..utils.logger import get_logger
 
+if TYPE_CHECKING:
+    from ..agents import GitAgent, PRAzureDevOpsAgent, SonarQubeAgent
+
 logger = get_logger(__name__)
 
+# Agents are imported inside the functions that use them, so importing the graph
+# doesn't load every agent's SDK (GitPython, Azure DevOps, LangChain) up front.
+
+
+def _git_agent(git_settings: Any) -> "GitAgent":
+    """
+    New GitAgent for one node run.
+
+    GitAgent holds the repository handle for the checkout it works on, so it
+    isn't shared between workflows; create_pr reopens the checkout from
+    ``repo_path`` instead.
+    """
+    from ..agents.git_agent import GitAgent
+
+    return GitAgent(
+        organization_url=git_settings.organization_url,
+        project=git_settings.project,
+        token=git_settings.token,
+        base_branch=git_settings.base_branch,
+        branch_prefix=git_settings.branch_prefix,
+    )
+
+
+@functools.lru_cache(maxsize=4)
+def _pr_agent(organization_url: str, project: str, token: str, base_branch: str) -> "PRAzureDevOpsAgent":
+    """PRAzureDevOpsAgent reused across workflows with the same settings."""
+    from ..agents.pr_agent import PRAzureDevOpsAgent
+
+    return PRAzureDevOpsAgent(
+        organization_url=organization_url,
+        project=project,
+        token=token,
+        base_branch=base_branch,
+    )
+
+
+@functools.lru_cache(maxsize=4)
+def _sonar_agent(sonar_url: str, sonar_token: str) -> "SonarQubeAgent":
+    """
+    SonarQubeAgent shared across workflows, keeping its per-page ETag cache.
+
+    The agent opens its HTTP client per run on that run's event loop, and each
+    run revalidates against its own copy of the cached pages, publishing it
+    under the agent's lock when done, so workflow threads can share it.
+    """
+    from ..agents.sonar_agent import SonarQubeAgent
+
+    return SonarQubeAgent(sonar_url=sonar_url, sonar_token=sonar_token)
+
+
+def _workspace_path(repo_url: str) -> Path:
+    """Local checkout path for a repository URL."""
+    repo_name = repo_url.split("/")[-1].replace(".git", "")
+    return Path("./workspaces") / repo_name
+
 
 def clone_repository_node(state: WorkflowState) -> Dict[str, Any]:
     """Node: Clone the target repository."""
@@ -24,21 +76,15 @@ def clone_repository_node(state: WorkflowState) -> Dict[str, Any]:
     
     settings = get_settings()
     
-    git_agent = GitAgent(
-        organization_url=settings.git.organization_url,
-        project=settings.git.project,
-        token=settings.git.token,
-        base_branch=settings.git.base_branch,
-        branch_prefix=settings.git.branch_prefix,
-    )
-    
     # Generate local path
-    repo_name = state["repo_url"].split("/")[-1].replace(".git", "")
-    local_path = Path("./workspaces") / repo_name
+    local_path = _workspace_path(state.repo_url)
+    repo_name = local_path.name
+    
+    git_agent = _git_agent(settings.git)
     
     result = git_agent.run({
         "operation": "clone",
-        "repo_url": state["repo_url"],
+        "repo_url": state.repo_url,
         "local_path": str(local_path),
     })
     
@@ -62,13 +108,10 @@ def check_coverage_node(state: WorkflowState) -> Dict[str, Any]:
     
     settings = get_settings()
     
-    sonar_agent = SonarQubeAgent(
-        sonar_url=settings.sonarqube.url,
-        sonar_token=settings.sonarqube.token,
-    )
+    sonar_agent = _sonar_agent(settings.sonarqube.url, settings.sonarqube.token)
     
     result = sonar_agent.run({
-        "project_key": state["sonar_project_key"],
+        "project_key": state.sonar_project_key,
     })
     
     if result.is_success():
@@ -87,22 +130,35 @@ def check_coverage_node(state: WorkflowState) -> Dict[str, Any]:
         }
 
 
+def join_node(state: WorkflowState) -> Dict[str, Any]:
+    """Node: Wait for the clone and coverage branches to both finish."""
+    missing = [key for key in ("repo_path", "coverage_before") if getattr(state, key) is None]
+    if missing:
+        logger.warning("Join: missing %s, skipping test generation", ", ".join(missing))
+    return {}
+
+
 def should_generate_tests(state: WorkflowState) -> str:
     """Decision node: Determine if tests need to be generated."""
-    coverage = state.get("coverage_before", 0)
-    threshold = state.get("coverage_threshold", 90)
+    if state.status == "failed":
+        logger.info("A setup step failed, skipping test generation")
+        return "end"
+    
+    coverage = state.coverage_before or 0
+    threshold = state.coverage_threshold
     
     if coverage < threshold:
-        logger.info(f"Coverage {coverage}% < {threshold}%, proceeding with test generation")
+        logger.info("Coverage %s%% < %s%%, proceeding with test generation", coverage, threshold)
         return "analyze_code"
     else:
-        logger.info(f"Coverage {coverage}% >= {threshold}%, skipping test generation")
+        logger.info("Coverage %s%% >= %s%%, skipping test generation", coverage, threshold)
         return "end"
 
 
 def analyze_code_node(state: WorkflowState) -> Dict[str, Any]:
     """Node: Analyze code to identify test candidates."""
     logger.info("Node: Analyzing code")
+    from ..agents.analyzer_agent import AnalyzerAgent
     
     settings = get_settings()
     
@@ -112,8 +168,8 @@ def analyze_code_node(state: WorkflowState) -> Dict[str, Any]:
     )
     
     result = analyzer_agent.run({
-        "repo_path": state["repo_path"],
-        "uncovered_files": state.get("uncovered_files", []),
+        "repo_path": state.repo_path,
+        "uncovered_files": state.uncovered_files,
     })
     
     if result.is_success():
@@ -132,6 +188,8 @@ def analyze_code_node(state: WorkflowState) -> Dict[str, Any]:
 def generate_tests_node(state: WorkflowState) -> Dict[str, Any]:
     """Node: Generate unit tests using LLM."""
     logger.info("Node: Generating tests")
+    from ..agents.test_gen_agent import TestGeneratorAgent
+    from ..llm import LLMFactory
     
     settings = get_settings()
     
@@ -142,13 +200,16 @@ def generate_tests_node(state: WorkflowState) -> Dict[str, Any]:
         llm_provider=llm,
         test_framework=settings.test_generation.framework,
         test_directory=settings.test_generation.test_directory,
+        max_concurrent=settings.llm.max_concurrency,
+        stream=settings.test_generation.stream,
     )
     
-    result = test_gen_agent.run({
-        "test_candidates": state["test_candidates"],
-        "repo_path": state["repo_path"],
+    # Candidates are generated concurrently on the agent's own event loop
+    result = run_async(test_gen_agent.arun({
+        "test_candidates": state.test_candidates,
+        "repo_path": state.repo_path,
         "max_tests": settings.workflow.max_tests_per_file,
-    })
+    }))
     
     if result.is_success():
         return {
@@ -170,14 +231,15 @@ def create_pr_node(state: WorkflowState) -> Dict[str, Any]:
     
     settings = get_settings()
     
-    # First, commit and push changes
-    git_agent = GitAgent(
-        organization_url=settings.git.organization_url,
-        project=settings.git.project,
-        token=settings.git.token,
-        base_branch=settings.git.base_branch,
-        branch_prefix=settings.git.branch_prefix,
-    )
+    # First, commit and push changes in this workflow's checkout
+    git_agent = _git_agent(settings.git)
+    open_result = git_agent.run({
+        "operation": "open",
+        "local_path": state.repo_path,
+    })
+    
+    if not open_result.is_success():
+        return {"errors": [open_result.error], "status": "failed", "current_step": "create_pr"}
     
     # Create branch
     timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
@@ -196,7 +258,7 @@ def create_pr_node(state: WorkflowState) -> Dict[str, Any]:
     commit_result = git_agent.run({
         "operation": "commit",
         "commit_message": "Add generated unit tests to improve code coverage",
-        "files_to_add": state["test_files"],
+        "files_to_add": state.test_files,
     })
     
     if not commit_result.is_success() and commit_result.status.value != "skipped":
@@ -211,20 +273,20 @@ def create_pr_node(state: WorkflowState) -> Dict[str, Any]:
         return {"errors": [push_result.error], "status": "failed", "current_step": "create_pr"}
     
     # Create PR
-    pr_agent = PRAzureDevOpsAgent(
-        organization_url=settings.git.organization_url,
-        project=settings.git.project,
-        token=settings.git.token,
-        base_branch=settings.git.base_branch,
+    pr_agent = _pr_agent(
+        settings.git.organization_url,
+        settings.git.project,
+        settings.git.token,
+        settings.git.base_branch,
     )
     
     pr_result = pr_agent.run({
-        "repository_id": state["repository_id"],
+        "repository_id": state.repository_id,
         "source_branch": branch_name,
         "pr_title": f"Improve code coverage - {timestamp}",
         "pr_description": "Automated code coverage improvement with generated unit tests",
-        "test_files": state["test_files"],
-        "coverage_before": state.get("coverage_before"),
+        "test_files": state.test_files,
+        "coverage_before": state.coverage_before,
     })
     
     if pr_result.is_success():
@@ -1,41 +1,60 @@
 """Workflow state definition."""
-from typing import TypedDict, List, Dict, Any, Optional
+import operator
+from typing import Annotated, List, Dict, Any, Optional
 
+from pydantic import BaseModel, ConfigDict, Field
 
-class WorkflowState(TypedDict, total=False):
-    """State for the code coverage workflow."""
+
+def _latest(left: Any, right: Any) -> Any:
+    """Reducer keeping the most recent write, so parallel branches may both set a key."""
+    return right
+
+
+class WorkflowState(BaseModel):
+    """
+    State for the code coverage workflow.
+
+    Nodes read fields as attributes and return partial-update dicts, which
+    LangGraph merges into the state.
+    """
+    model_config = ConfigDict(
+        frozen=False,
+        extra="allow",
+        validate_assignment=False,
+        arbitrary_types_allowed=True,
+    )
     
     # Input parameters
     repo_url: str
     sonar_project_key: str
-    coverage_threshold: int
+    coverage_threshold: int = 90
     
     # Repository information
-    repo_path: str
-    repository_id: str
+    repo_path: Optional[str] = None
+    repository_id: Optional[str] = None
     
     # Coverage data
-    coverage_before: float
-    coverage_metrics: Dict[str, float]
-    uncovered_files: List[Dict[str, Any]]
+    coverage_before: Optional[float] = None
+    coverage_metrics: Dict[str, float] = Field(default_factory=dict)
+    uncovered_files: List[Dict[str, Any]] = Field(default_factory=list)
     
     # Analysis results
-    test_candidates: List[Dict[str, Any]]
+    test_candidates: List[Dict[str, Any]] = Field(default_factory=list)
     
     # Generated content
-    generated_tests: List[Dict[str, Any]]
-    test_files: List[str]
+    generated_tests: List[Dict[str, Any]] = Field(default_factory=list)
+    test_files: List[str] = Field(default_factory=list)
     
     # Branch and PR information
-    branch_name: str
-    pr_id: Optional[int]
-    pr_url: Optional[str]
+    branch_name: Optional[str] = None
+    pr_id: Optional[int] = None
+    pr_url: Optional[str] = None
     
-    # Execution metadata
-    status: str
-    errors: List[str]
-    current_step: str
+    # Execution metadata; reducers merge writes from parallel branches
+    status: Annotated[Optional[str], _latest] = None
+    errors: Annotated[List[str], operator.add] = Field(default_factory=list)
+    current_step: Annotated[Optional[str], _latest] = None
     
     # Optional fields for checkpointing
-    timestamp: str
-    workflow_id: Optional[str]
+    timestamp: Optional[str] = None
+    workflow_id: Optional[str] = None
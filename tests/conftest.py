@@ -0,0 +1,15 @@
+"""Shared test configuration."""
+import os
+
+# Placeholders for the settings config/default.yaml requires, so modules that
+# load settings at import time (e.g. the API routes) can be imported in tests
+for _name in (
+    "AZURE_DEVOPS_ORG_URL",
+    "AZURE_DEVOPS_PROJECT",
+    "AZURE_DEVOPS_PAT",
+    "SONAR_URL",
+    "SONAR_TOKEN",
+    "SONAR_PROJECT_KEY",
+    "OPENAI_API_KEY",
+):
+    os.environ.setdefault(_name, "test")
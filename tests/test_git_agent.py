@@ -0,0 +1,59 @@
+"""Tests for GitAgent's local repository operations."""
+import subprocess
+
+import pytest
+
+pytest.importorskip("git")
+
+from src.agents.base_agent import AgentStatus
+from src.agents.git_agent import GitAgent
+
+
+@pytest.fixture
+def bare_identity(tmp_path, monkeypatch):
+    """Environment with no git identity: empty HOME, no system or env config."""
+    home = tmp_path / "home"
+    home.mkdir()
+    monkeypatch.setenv("HOME", str(home))
+    monkeypatch.setenv("XDG_CONFIG_HOME", str(home / ".config"))
+    monkeypatch.setenv("GIT_CONFIG_NOSYSTEM", "1")
+    for var in ("GIT_AUTHOR_NAME", "GIT_AUTHOR_EMAIL", "GIT_COMMITTER_NAME", "GIT_COMMITTER_EMAIL", "EMAIL"):
+        monkeypatch.delenv(var, raising=False)
+
+
+@pytest.fixture
+def repo_path(tmp_path, bare_identity):
+    path = tmp_path / "repo"
+    subprocess.run(["git", "init", "--quiet", str(path)], check=True)
+    return path
+
+
+def test_commit_without_configured_identity(repo_path):
+    (repo_path / "tests").mkdir()
+    (repo_path / "tests" / "test_module.py").write_text("def test_ok():\n    pass\n")
+    agent = GitAgent(organization_url="https://dev.azure.com/org", project="project", token="token")
+
+    assert agent.run({"operation": "open", "local_path": str(repo_path)}).is_success()
+    result = agent.run({
+        "operation": "commit",
+        "commit_message": "Add tests",
+        "files_to_add": ["tests/test_module.py"],
+    })
+
+    assert result.status == AgentStatus.SUCCESS
+    log = subprocess.run(
+        ["git", "log", "-1", "--format=%s|%ae|%ce"],
+        cwd=repo_path, check=True, capture_output=True, text=True,
+    ).stdout.strip()
+    subject, author_email, committer_email = log.split("|")
+    assert subject == "Add tests"
+    assert author_email and committer_email
+
+
+def test_commit_without_changes_is_skipped(repo_path):
+    agent = GitAgent(organization_url="https://dev.azure.com/org", project="project", token="token")
+    agent.run({"operation": "open", "local_path": str(repo_path)})
+
+    result = agent.run({"operation": "commit", "commit_message": "Nothing"})
+
+    assert result.status == AgentStatus.SKIPPED
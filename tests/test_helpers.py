@@ -0,0 +1,48 @@
+"""Tests for async helper utilities."""
+import asyncio
+
+from src.utils.helpers import register_loop_cleanup, run_async
+
+
+def test_loop_cleanups_run_before_loop_closes():
+    events = []
+
+    async def cleanup():
+        events.append(("cleanup", asyncio.get_running_loop().is_closed()))
+
+    async def work():
+        assert register_loop_cleanup(cleanup)
+        # Registered from a nested task, still tied to the same loop
+        await asyncio.create_task(asyncio.sleep(0))
+        events.append("work")
+        return 42
+
+    assert run_async(work()) == 42
+    assert events == ["work", ("cleanup", False)]
+
+
+def test_loop_cleanups_run_when_coroutine_fails():
+    events = []
+
+    async def cleanup():
+        events.append("cleanup")
+
+    async def work():
+        register_loop_cleanup(cleanup)
+        raise ValueError("boom")
+
+    try:
+        run_async(work())
+    except ValueError:
+        pass
+    assert events == ["cleanup"]
+
+
+def test_register_outside_run_async_is_refused():
+    async def cleanup():
+        raise AssertionError("should not run")
+
+    async def work():
+        return register_loop_cleanup(cleanup)
+
+    assert asyncio.run(work()) is False
@@ -0,0 +1,138 @@
+"""Tests for batched generation on LLM providers."""
+import asyncio
+import json
+import time
+
+import pytest
+
+from src.llm.base import BaseLLMProvider, LLMError, LLMResponse, PromptSpec
+
+
+class _EchoProvider(BaseLLMProvider):
+    """Provider echoing prompts; earlier prompts finish last, 'fail' prompts raise."""
+
+    def generate(self, prompt, system_message=None, **kwargs):
+        time.sleep(self.config["delays"].get(prompt, 0))
+        if prompt.startswith("fail"):
+            raise LLMError(prompt)
+        return LLMResponse(content=f"{system_message or ''}{prompt}", model="echo")
+
+    def generate_with_schema(self, prompt, schema, system_message=None, **kwargs):
+        return {"prompt": prompt}
+
+
+SPECS = [
+    PromptSpec("a"),
+    PromptSpec("fail-b"),
+    PromptSpec("c", system_message="sys:"),
+    PromptSpec("d", schema={"type": "object"}),
+]
+DELAYS = {"a": 0.05, "fail-b": 0.03, "c": 0.01}
+
+
+def _assert_ordered(results):
+    assert results[0].content == "a"
+    assert isinstance(results[1], LLMError)
+    assert results[2].content == "sys:c"
+    assert json.loads(results[3].content) == {"prompt": "d"}
+
+
+def test_generate_batch_keeps_order_with_exceptions():
+    provider = _EchoProvider(delays=DELAYS)
+
+    _assert_ordered(provider.generate_batch(SPECS, max_concurrency=4, return_exceptions=True))
+
+
+def test_agenerate_batch_keeps_order_with_exceptions():
+    provider = _EchoProvider(delays=DELAYS)
+
+    _assert_ordered(asyncio.run(provider.agenerate_batch(SPECS, max_concurrency=4, return_exceptions=True)))
+
+
+def test_generate_batch_raises_without_return_exceptions():
+    provider = _EchoProvider(delays={})
+
+    with pytest.raises(LLMError):
+        provider.generate_batch(SPECS)
+    with pytest.raises(LLMError):
+        asyncio.run(provider.agenerate_batch(SPECS))
+
+
+class _FakeDispatcher:
+    """Stands in for FleetDispatcher, answering each spec immediately."""
+
+    instances = []
+
+    def __init__(self, **kwargs):
+        self.kwargs = kwargs
+        self.submitted = []
+        _FakeDispatcher.instances.append(self)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        pass
+
+    async def submit(self, spec):
+        self.submitted.append(spec)
+        await asyncio.sleep(0.01 if spec.prompt == "a" else 0)
+        if spec.prompt.startswith("fail"):
+            raise LLMError(spec.prompt)
+        return LLMResponse(content=f"batch:{spec.prompt}", model="gpt-test")
+
+
+@pytest.fixture
+def openai_provider(monkeypatch):
+    pytest.importorskip("langchain_core")
+    from src.llm import batch_dispatcher
+    from src.llm.providers.openai import OpenAIProvider
+
+    _FakeDispatcher.instances = []
+    monkeypatch.setattr(batch_dispatcher, "FleetDispatcher", _FakeDispatcher)
+
+    def create(latency_budget_ms):
+        return OpenAIProvider(
+            api_key="test",
+            model="gpt-test",
+            latency_budget_ms=latency_budget_ms,
+            batch_sync_threshold_ms=300000,
+        )
+
+    return create
+
+
+@pytest.mark.parametrize("latency_budget_ms, expected", [(0, False), (300000, False), (300001, True)])
+def test_use_batch_api_threshold(openai_provider, latency_budget_ms, expected):
+    assert openai_provider(latency_budget_ms)._use_batch_api() is expected
+
+
+def test_batch_api_routes_through_dispatcher(openai_provider):
+    provider = openai_provider(3_600_000)
+    specs = [PromptSpec("a"), PromptSpec("fail-b"), PromptSpec("c")]
+
+    results = asyncio.run(provider.agenerate_batch(specs, return_exceptions=True))
+
+    assert [r.content if isinstance(r, LLMResponse) else type(r) for r in results] == [
+        "batch:a", LLMError, "batch:c",
+    ]
+    (dispatcher,) = _FakeDispatcher.instances
+    assert dispatcher.submitted == specs
+    assert dispatcher.kwargs["batch_min_size"] == len(specs)
+
+    assert [r.content for r in provider.generate_batch([PromptSpec("x")])] == ["batch:x"]
+    assert len(_FakeDispatcher.instances) == 2
+
+
+def test_sync_budget_skips_dispatcher(openai_provider, monkeypatch):
+    provider = openai_provider(0)
+
+    async def agenerate(prompt, system_message=None, **kwargs):
+        return LLMResponse(content=f"direct:{prompt}", model="gpt-test")
+
+    monkeypatch.setattr(provider, "agenerate", agenerate)
+
+    results = asyncio.run(provider.agenerate_batch([PromptSpec("a"), PromptSpec("b")]))
+
+    assert [r.content for r in results] == ["direct:a", "direct:b"]
+    assert _FakeDispatcher.instances == []
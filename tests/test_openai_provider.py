@@ -0,0 +1,75 @@
+"""Tests for the OpenAI provider's client handling."""
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+pytest.importorskip("langchain_openai")
+
+from src.llm.providers.openai import OpenAIProvider
+from src.utils.helpers import run_async
+
+_COMPLETION = {
+    "id": "chatcmpl-test",
+    "object": "chat.completion",
+    "created": 0,
+    "model": "gpt-test",
+    "choices": [
+        {
+            "index": 0,
+            "message": {"role": "assistant", "content": "ok"},
+            "finish_reason": "stop",
+        }
+    ],
+    "usage": {"prompt_tokens": 1, "completion_tokens": 1, "total_tokens": 2},
+}
+
+
+class _CompletionHandler(BaseHTTPRequestHandler):
+    # Keep-alive, so a pooled connection outlives the loop that opened it
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        body = json.dumps(_COMPLETION).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def openai_server(monkeypatch):
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _CompletionHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    monkeypatch.setenv("OPENAI_API_BASE", f"http://127.0.0.1:{server.server_port}/v1")
+    yield
+    server.shutdown()
+    server.server_close()
+
+
+def test_agenerate_across_run_async_calls(openai_server, monkeypatch):
+    provider = OpenAIProvider(api_key="test", model="gpt-test", cache_enabled=False)
+    http_clients = []
+    new_http_async_client = provider._new_http_async_client
+
+    def track_http_async_client():
+        http_clients.append(new_http_async_client())
+        return http_clients[-1]
+
+    monkeypatch.setattr(provider, "_new_http_async_client", track_http_async_client)
+
+    first = run_async(provider.agenerate("hello"))
+    second = run_async(provider.agenerate("hello"))
+
+    assert first.content == second.content == "ok"
+    # Each loop got its own client, closed when the loop shut down
+    assert len(http_clients) == 2
+    assert all(client.is_closed for client in http_clients)
+    assert provider._async_clients == {}
@@ -0,0 +1,110 @@
+"""Tests for client-side LLM rate limiting."""
+import asyncio
+
+import pytest
+
+from src.llm import rate_limiter
+from src.llm.rate_limiter import TokenBucket, estimate_tokens
+
+
+class _FakeClock:
+    """
+    Stands in for the time module; sleeping advances the clock.
+
+    Rates and amounts in these tests are powers of two so waits are exact
+    in floating point.
+    """
+
+    def __init__(self):
+        self.now = 1024.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+    async def async_sleep(self, seconds):
+        self.sleep(seconds)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = _FakeClock()
+    monkeypatch.setattr(rate_limiter, "time", clock)
+    monkeypatch.setattr(rate_limiter.asyncio, "sleep", clock.async_sleep)
+    return clock
+
+
+def test_refills_at_rate(clock):
+    bucket = TokenBucket(rate=8, capacity=8)
+    bucket.acquire_sync(8)
+
+    clock.now += 0.5
+    bucket.acquire_sync(4)
+
+    assert clock.sleeps == []
+
+
+def test_burst_is_capped_at_capacity(clock):
+    bucket = TokenBucket(rate=8, capacity=8)
+    bucket.acquire_sync(8)
+
+    # A long idle period refills only up to capacity
+    clock.now += 4096
+    bucket.acquire_sync(8)
+    bucket.acquire_sync(1)
+
+    assert clock.sleeps == [0.125]
+
+
+def test_acquire_blocks_until_enough_tokens(clock):
+    bucket = TokenBucket(rate=8, capacity=8)
+    bucket.acquire_sync(6)
+
+    bucket.acquire_sync(4)
+
+    assert clock.sleeps == [0.25]
+    # Nothing left over after the wait
+    assert bucket._reserve(1) == 0.125
+
+
+def test_async_acquire_blocks_until_enough_tokens(clock):
+    bucket = TokenBucket(rate=8, capacity=8)
+
+    async def acquire():
+        await bucket.acquire(6)
+        await bucket.acquire(4)
+
+    asyncio.run(acquire())
+
+    assert clock.sleeps == [0.25]
+
+
+def test_oversized_request_is_clamped_to_capacity(clock):
+    bucket = TokenBucket(rate=8, capacity=8)
+
+    bucket.acquire_sync(64)
+    bucket.acquire_sync(64)
+
+    assert clock.sleeps == [1.0]
+
+
+def test_per_minute():
+    bucket = TokenBucket.per_minute(120)
+
+    assert bucket.rate == 2.0
+    assert bucket.capacity == 120.0
+
+
+def test_rate_must_be_positive():
+    with pytest.raises(ValueError):
+        TokenBucket(rate=0)
+
+
+def test_estimate_tokens_without_tokenizer(monkeypatch):
+    monkeypatch.setattr(rate_limiter, "_encoding", lambda model: None)
+
+    assert estimate_tokens("gpt-4", "a" * 40, None, "", "b" * 7) == 11 + 2
@@ -0,0 +1,30 @@
+"""Tests for configuration loading helpers."""
+import pytest
+
+from src.config.settings import ConfigurationError, substitute_env_vars
+
+
+def test_substitutes_nested_values_in_place(monkeypatch):
+    monkeypatch.setenv("PRAGENTS_TEST_HOST", "example.com")
+    config = {"api": {"host": "${PRAGENTS_TEST_HOST}", "ports": ["${PRAGENTS_TEST_PORT:8000}"]}}
+
+    assert substitute_env_vars(config) is config
+    assert config == {"api": {"host": "example.com", "ports": ["8000"]}}
+
+
+def test_substitutes_top_level_string(monkeypatch):
+    monkeypatch.setenv("PRAGENTS_TEST_NAME", "agent")
+
+    assert substitute_env_vars("${PRAGENTS_TEST_NAME}-1") == "agent-1"
+
+
+@pytest.mark.parametrize("value", [42, 1.5, True, None])
+def test_returns_top_level_scalars_unchanged(value):
+    assert substitute_env_vars(value) is value
+
+
+def test_missing_required_variable_raises(monkeypatch):
+    monkeypatch.delenv("PRAGENTS_TEST_MISSING", raising=False)
+
+    with pytest.raises(ConfigurationError):
+        substitute_env_vars({"key": "${PRAGENTS_TEST_MISSING}"})
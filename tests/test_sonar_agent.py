@@ -0,0 +1,157 @@
+"""Tests for SonarQube coverage fetching against a fake server."""
+import json
+
+import httpx
+import pytest
+
+from src.agents import sonar_agent
+from src.agents.sonar_agent import SonarQubeAgent
+
+PAGE_SIZE = 2
+
+
+class _ChunkedStream(httpx.AsyncByteStream):
+    """Response body delivered in small chunks, so parsing spans several reads."""
+
+    def __init__(self, body: bytes, chunk_size: int = 7):
+        self._body = body
+        self._chunk_size = chunk_size
+
+    async def __aiter__(self):
+        for start in range(0, len(self._body), self._chunk_size):
+            yield self._body[start:start + self._chunk_size]
+
+
+class _FakeSonar:
+    """Serves the measures APIs with per-page ETags, answering 304 when unchanged."""
+
+    def __init__(self, components):
+        self.components = components
+        self.versions = {}
+        self.requests = []
+
+    def page(self, index):
+        start = (index - 1) * PAGE_SIZE
+        return self.components[start:start + PAGE_SIZE]
+
+    def etag(self, index):
+        return f'"{index}-{self.versions.get(index, 0)}"'
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/api/measures/component":
+            body = {"component": {"measures": [{"metric": "coverage", "value": "72.5"}]}}
+            return httpx.Response(200, json=body)
+
+        index = int(request.url.params["p"])
+        assert int(request.url.params["ps"]) == PAGE_SIZE
+        if_none_match = request.headers.get("If-None-Match")
+        self.requests.append((index, if_none_match))
+        if if_none_match == self.etag(index):
+            return httpx.Response(304)
+
+        body = json.dumps({
+            "paging": {"pageIndex": index, "pageSize": PAGE_SIZE, "total": len(self.components)},
+            "baseComponent": {"key": "project"},
+            "components": self.page(index),
+        }).encode()
+        return httpx.Response(
+            200,
+            headers={"ETag": self.etag(index), "Content-Type": "application/json"},
+            stream=_ChunkedStream(body),
+        )
+
+
+def _component(path, coverage, uncovered, language=None):
+    component = {
+        "key": f"project:{path}",
+        "path": path,
+        "measures": [
+            {"metric": "coverage", "value": str(coverage)},
+            {"metric": "uncovered_lines", "value": str(uncovered)},
+        ],
+    }
+    if language:
+        component["language"] = language
+    return component
+
+
+@pytest.fixture(params=["ijson", "json"])
+def parser(request, monkeypatch):
+    """Run each test with the streaming ijson parser and with whole-page parsing."""
+    if request.param == "ijson":
+        monkeypatch.setattr(sonar_agent, "ijson", pytest.importorskip("ijson"))
+    else:
+        monkeypatch.setattr(sonar_agent, "ijson", None)
+    monkeypatch.setattr(sonar_agent, "_PAGE_SIZE", PAGE_SIZE)
+    return request.param
+
+
+@pytest.fixture
+def server(parser):
+    return _FakeSonar([
+        _component("src/a.py", 50.0, 10),
+        _component("src/b.py", 100.0, 0),
+        _component("src/c.ts", 80.0, 4),
+        _component("src/d.py", 0.0, 7, language="py"),
+        _component("src/e.py", 100.0, 0),
+    ])
+
+
+@pytest.fixture
+def agent(server, monkeypatch):
+    agent = SonarQubeAgent(sonar_url="https://sonar.example.com/", sonar_token="token")
+    monkeypatch.setattr(
+        agent, "_create_client", lambda: httpx.AsyncClient(transport=httpx.MockTransport(server.handler))
+    )
+    return agent
+
+
+def _fetch(agent):
+    result = agent.run({"project_key": "project"})
+    assert result.is_success(), result.error
+    return result.data
+
+
+def test_aggregates_uncovered_files_across_pages(agent, server):
+    data = _fetch(agent)
+
+    assert data["coverage"] == 72.5
+    assert data["uncovered_files"] == [
+        {"path": "src/a.py", "coverage": 50.0, "uncovered_area": 10, "language": "python"},
+        {"path": "src/c.ts", "coverage": 80.0, "uncovered_area": 4, "language": "typescript"},
+        {"path": "src/d.py", "coverage": 0.0, "uncovered_area": 7, "language": "py"},
+    ]
+    assert data["uncovered_lines"] == 21
+    assert sorted(server.requests) == [(1, None), (2, None), (3, None)]
+
+
+def test_revalidates_pages_with_etags(agent, server):
+    first = _fetch(agent)
+    server.requests.clear()
+
+    # Unchanged pages come back as 304 and are served from the cache
+    assert _fetch(agent) == first
+    assert sorted(server.requests) == [(1, '"1-0"'), (2, '"2-0"'), (3, '"3-0"')]
+
+    # A change on a later page is picked up while the others stay cached
+    server.components[2] = _component("src/c.ts", 90.0, 2)
+    server.versions[2] = 1
+    server.requests.clear()
+
+    data = _fetch(agent)
+
+    assert [f["uncovered_area"] for f in data["uncovered_files"]] == [10, 2, 7]
+    assert data["uncovered_lines"] == 19
+    assert sorted(server.requests) == [(1, '"1-0"'), (2, '"2-0"'), (3, '"3-0"')]
+    assert agent._coverage_cache["project"][2][0] == '"2-1"'
+
+
+def test_drops_cached_pages_past_the_end(agent, server):
+    _fetch(agent)
+
+    del server.components[2:]
+    server.versions[1] = 1
+    data = _fetch(agent)
+
+    assert [f["path"] for f in data["uncovered_files"]] == ["src/a.py"]
+    assert sorted(agent._coverage_cache["project"]) == [1]
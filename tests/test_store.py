@@ -0,0 +1,81 @@
+"""Tests for the SQLite-backed workflow store."""
+import asyncio
+
+import pytest
+
+pytest.importorskip("aiosqlite")
+
+from src.api.store import WorkflowStore
+
+
+def _workflow(index: int) -> dict:
+    return {
+        "workflow_id": f"wf-{index}",
+        "status": "pending",
+        "created_at": f"2026-01-01T00:00:{index:02d}",
+    }
+
+
+@pytest.fixture(params=["shared", "per-call"])
+def run_with_store(request, tmp_path):
+    """Run a coroutine function against a store, with and without a shared connection."""
+    def run(test):
+        async def main():
+            store = WorkflowStore(str(tmp_path / "db" / "workflows.db"))
+            if request.param == "shared":
+                await store.open()
+            try:
+                return await test(store)
+            finally:
+                await store.close()
+
+        return asyncio.run(main())
+
+    return run
+
+
+def test_create_get_and_missing(run_with_store):
+    async def test(store):
+        await store.create(_workflow(1))
+        assert await store.get("wf-1") == _workflow(1)
+        assert await store.get("missing") is None
+        assert await store.update("missing", status="running") is None
+
+    run_with_store(test)
+
+
+def test_list_pagination_and_order(run_with_store):
+    async def test(store):
+        # Created out of order; listing follows created_at
+        for index in (3, 1, 4, 0, 2):
+            await store.create(_workflow(index))
+
+        ids = lambda workflows: [w["workflow_id"] for w in workflows]
+        assert ids(await store.list()) == ["wf-0", "wf-1", "wf-2", "wf-3", "wf-4"]
+        assert ids(await store.list(limit=2)) == ["wf-0", "wf-1"]
+        assert ids(await store.list(limit=2, offset=2)) == ["wf-2", "wf-3"]
+        assert ids(await store.list(limit=2, offset=4)) == ["wf-4"]
+        assert ids(await store.list(limit=2, descending=True)) == ["wf-4", "wf-3"]
+        assert ids(await store.list(limit=2, offset=2, descending=True)) == ["wf-2", "wf-1"]
+
+    run_with_store(test)
+
+
+def test_concurrent_updates_are_not_lost(run_with_store):
+    async def test(store):
+        await store.create(_workflow(1))
+
+        results = await asyncio.gather(*(
+            store.update("wf-1", status="running", **{f"step_{i}": i})
+            for i in range(20)
+        ))
+
+        assert all(result is not None for result in results)
+        workflow = await store.get("wf-1")
+        assert workflow["status"] == "running"
+        assert {key: workflow[key] for key in workflow if key.startswith("step_")} == {
+            f"step_{i}": i for i in range(20)
+        }
+        assert len(await store.list()) == 1
+
+    run_with_store(test)
@@ -0,0 +1,43 @@
+"""Tests for test generation output cleanup."""
+import pytest
+
+from src.agents import test_gen_agent
+
+
+def _stream(text: str, chunk_size: int) -> str:
+    """Run text through a _CodeFenceFilter in chunks of chunk_size."""
+    fence_filter = test_gen_agent._CodeFenceFilter()
+    chunks = [text[i:i + chunk_size] for i in range(0, len(text), chunk_size)]
+    return "".join(fence_filter.feed(chunk) for chunk in chunks) + fence_filter.finish()
+
+
+def _clean(text: str) -> str:
+    return test_gen_agent.TestGeneratorAgent._clean_generated_code(None, text)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 4, 1000])
+@pytest.mark.parametrize("text, expected", [
+    # Fence split across chunks, with prose around it
+    ("Here you go:\n```python\ndef test_a():\n    assert 1\n```\nDone.", "def test_a():\n    assert 1"),
+    # Closing fence never arrives
+    ("```python\nimport pytest\n\n\ndef test_a():\n    pass\n", "import pytest\n\n\ndef test_a():\n    pass"),
+    # Four-backtick fence wrapping code that contains a three-backtick string
+    ("````python\nDOC = '```'\n````\n", "DOC = '```'"),
+    ("`````\nx = 1\n`````", "x = 1"),
+    # Backticks inside the body that aren't a fence
+    ("```python\ns = '``'\n```", "s = '``'"),
+    # Unfenced output
+    ("\ndef test_a():\n    pass\n\n", "def test_a():\n    pass"),
+])
+def test_code_fence_filter_matches_full_cleanup(text, expected, chunk_size):
+    assert _clean(text) == expected
+    assert _stream(text, chunk_size) == expected
+
+
+def test_code_fence_filter_emits_body_before_stream_ends():
+    fence_filter = test_gen_agent._CodeFenceFilter()
+
+    assert fence_filter.feed("```python\nx = 1\n") == "x = 1"
+    assert fence_filter.feed("y = 2\n``") == "\ny = 2"
+    assert fence_filter.feed("`\n") == ""
+    assert fence_filter.finish() == ""